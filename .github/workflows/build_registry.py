@@ -2,13 +2,21 @@
 """Build aggregated registry.json from individual agent directories."""
 
 import argparse
+import contextlib
+import functools
 import json
 import os
 import re
+import shutil
 import sys
+import threading
+import time
 import urllib.error
 import urllib.request
 import xml.etree.ElementTree as ET
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 
 from registry_utils import (
@@ -16,7 +24,9 @@ from registry_utils import (
     extract_npm_package_name,
     extract_npm_package_version,
     extract_pypi_package_name,
+    load_json,
     normalize_version,
+    write_json,
 )
 
 try:
@@ -26,26 +36,60 @@ try:
 except ImportError:
     HAS_JSONSCHEMA = False
 
+try:
+    import fastjsonschema
+
+    HAS_FASTJSONSCHEMA = True
+except ImportError:
+    HAS_FASTJSONSCHEMA = False
+
 REGISTRY_VERSION = "1.0.0"
-REQUIRED_FIELDS = {"id", "name", "version", "description", "distribution"}
-VALID_DISTRIBUTION_TYPES = {"binary", "npx", "uvx"}
-VALID_PLATFORMS = {
-    "darwin-aarch64",
-    "darwin-x86_64",
-    "linux-aarch64",
-    "linux-x86_64",
-    "windows-aarch64",
-    "windows-x86_64",
-}
-REQUIRED_OS_FAMILIES = {"darwin", "linux", "windows"}
+REQUIRED_FIELDS = frozenset({"id", "name", "version", "description", "distribution"})
+VALID_DISTRIBUTION_TYPES = frozenset({"binary", "npx", "uvx"})
+VALID_PLATFORMS = frozenset(
+    {
+        "darwin-aarch64",
+        "darwin-x86_64",
+        "linux-aarch64",
+        "linux-x86_64",
+        "windows-aarch64",
+        "windows-x86_64",
+    }
+)
+REQUIRED_BINARY_TARGET_FIELDS = frozenset({"archive", "cmd"})
+# e.g. "linux-x86_64" -> "linux"
+_PLATFORM_TO_OS = {platform: platform.split("-", 1)[0] for platform in VALID_PLATFORMS}
+REQUIRED_OS_FAMILIES = frozenset({"darwin", "linux", "windows"})
+_AGENT_ID_RE = re.compile(r"[a-z][a-z0-9-]*")
+# major.minor.patch, optionally followed by further dot-separated parts
+_SEMVER_RE = re.compile(r"\d+\.\d+\.\d+(?:\.|\Z)")
 REJECTED_ARCHIVE_EXTENSIONS = (".dmg", ".pkg", ".deb", ".rpm", ".msi", ".appimage")
 
+# Per-agent validation is dominated by file and network I/O, so use more threads than cores
+MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Maximum concurrent URL checks across the whole build, so that a cold-cache build
+# does not burst requests at npm, PyPI and GitHub and get rate limited
+URL_CHECK_WORKERS = 16
+
 # Can be overridden via environment variable
 DEFAULT_BASE_URL = "https://cdn.agentclientprotocol.com/registry/v1/latest"
 
 # Icon requirements
 PREFERRED_ICON_SIZE = 16
-ALLOWED_FILL_STROKE_VALUES = {"currentcolor", "none", "inherit"}
+ALLOWED_FILL_STROKE_VALUES = frozenset({"currentcolor", "none", "inherit"})
+# fill/stroke declarations inside <style> blocks, matched in a single scan
+_CSS_FILL_STROKE_RE = re.compile(r"\b(fill|stroke)\s*:\s*([^;}\s]+)", re.IGNORECASE)
+# Splits an SVG length like "16px" into its number and (ignored) unit in one match
+_SVG_LENGTH_RE = re.compile(r"\s*(.*?)[a-z%]*\s*", re.IGNORECASE | re.DOTALL)
+
+# Version extraction from distribution URLs and package specs
+# GitHub releases: /download/v1.0.0/ or /releases/v1.0.0/
+_GITHUB_RELEASE_VERSION_RE = re.compile(r"/(?:download|releases)/v?([\d.]+)/")
+# npm tarballs: /-/package-1.0.0.tgz
+_NPM_TARBALL_VERSION_RE = re.compile(r"/-/[^/]+-(\d+\.\d+\.\d+)\.tgz")
+# uvx specs: package==version, package>=version, package@version
+_UVX_VERSION_RE = re.compile(r"[=@]+([\d.]+)")
 
 # URL validation
 SKIP_URL_VALIDATION = os.environ.get("SKIP_URL_VALIDATION", "").lower() in (
@@ -54,21 +98,61 @@ SKIP_URL_VALIDATION = os.environ.get("SKIP_URL_VALIDATION", "").lower() in (
     "yes",
 )
 
-
-def url_exists(url: str, method: str = "HEAD", retries: int = 3) -> bool:
-    """Check if a URL exists using HEAD or GET request with retries."""
-    import time
-
+# Optional on-disk cache of successful URL checks, reused across builds (e.g. in CI)
+URL_CACHE_FILE = os.environ.get("URL_CACHE_FILE", "")
+URL_CACHE_TTL = 24 * 60 * 60  # seconds
+# Older successes are re-checked with a conditional request using their ETag or
+# Last-Modified value, which are kept for this long
+URL_CACHE_MAX_AGE = 7 * 24 * 60 * 60  # seconds
+
+# url -> {"checked_at", "etag", "last_modified"} from its last successful check.
+# Failures are never cached so that transient network errors are always retried.
+_url_cache: dict[str, dict] = {}
+_url_checks_lock = threading.Lock()
+# Shared by the per-agent pools, which themselves run concurrently
+_url_check_slots = threading.BoundedSemaphore(URL_CHECK_WORKERS)
+
+# Optional on-disk cache of icon validation results for incremental local builds
+ICON_CACHE_FILE = os.environ.get("ICON_CACHE_FILE", "")
+
+# icon path -> {"mtime_ns", "size", "errors"} from the last validation of that file
+_icon_cache: dict[str, dict] = {}
+
+
+def url_exists(
+    url: str,
+    method: str = "HEAD",
+    retries: int = 3,
+    validators: dict[str, str] | None = None,
+) -> bool:
+    """Check if a URL exists using HEAD or GET request with retries.
+
+    validators may hold the "etag" and "last_modified" of an earlier successful
+    check. They are sent as conditional headers, a 304 Not Modified counts as
+    success, and the dict is updated with the values from a fresh response.
+    """
     for attempt in range(retries):
         try:
             req = urllib.request.Request(url, method=method)
             req.add_header("User-Agent", "ACP-Registry-Validator/1.0")
+            if validators:
+                if validators.get("etag"):
+                    req.add_header("If-None-Match", validators["etag"])
+                if validators.get("last_modified"):
+                    req.add_header("If-Modified-Since", validators["last_modified"])
             with urllib.request.urlopen(req, timeout=15) as response:
+                if validators is not None:
+                    validators["etag"] = response.headers.get("ETag")
+                    validators["last_modified"] = response.headers.get("Last-Modified")
                 return response.status in (200, 301, 302)
         except urllib.error.HTTPError as e:
+            if e.code == 304:
+                return True
             # Some servers don't support HEAD, try GET
             if method == "HEAD" and e.code in (403, 405):
-                return url_exists(url, method="GET", retries=retries - attempt)
+                return url_exists(
+                    url, method="GET", retries=retries - attempt, validators=validators
+                )
             if attempt < retries - 1 and e.code in (429, 500, 502, 503, 504):
                 time.sleep(2**attempt)
                 continue
@@ -81,14 +165,83 @@ def url_exists(url: str, method: str = "HEAD", retries: int = 3) -> bool:
     return False
 
 
+def load_url_cache(path: Path) -> None:
+    """Load successful URL checks saved by a previous build.
+
+    Entries past URL_CACHE_TTL are kept only if they have validators to send
+    with a conditional re-check.
+    """
+    try:
+        data = load_json(path)
+    except (json.JSONDecodeError, OSError):
+        return
+    if not isinstance(data, dict):
+        return
+    now = time.time()
+    for url, entry in data.items():
+        if not isinstance(entry, dict) or not isinstance(entry.get("checked_at"), (int, float)):
+            continue
+        age = now - entry["checked_at"]
+        has_validators = bool(entry.get("etag") or entry.get("last_modified"))
+        if age < URL_CACHE_TTL or (has_validators and age < URL_CACHE_MAX_AGE):
+            _url_cache[url] = entry
+
+
+def save_url_cache(path: Path) -> None:
+    """Persist successful URL checks for the next build."""
+    try:
+        write_json(path, _url_cache)
+    except OSError as e:
+        print(f"Warning: Could not write URL cache {path}: {e}")
+
+
+def check_url(url: str) -> bool:
+    """Check that a URL is accessible, trusting a recent success from the URL cache.
+
+    At most URL_CHECK_WORKERS requests are in flight at once across all threads.
+    """
+    if not URL_CACHE_FILE:
+        with _url_check_slots:
+            return url_exists(url)
+    cached = _url_cache.get(url, {})
+    if time.time() - cached.get("checked_at", 0) < URL_CACHE_TTL:
+        return True
+    validators = {
+        "etag": cached.get("etag"),
+        "last_modified": cached.get("last_modified"),
+    }
+    with _url_check_slots:
+        exists = url_exists(url, validators=validators)
+    if exists:
+        _url_cache[url] = {"checked_at": time.time(), **validators}
+    return exists
+
+
+def check_url_once(url: str, url_checks: dict[str, Future]) -> bool:
+    """check_url(), sharing a single check between all callers asking for the same URL.
+
+    url_checks maps each URL to the future of its check. A caller that finds a
+    check already started waits for its result instead of probing again.
+    """
+    with _url_checks_lock:
+        future = url_checks.get(url)
+        is_owner = future is None
+        if is_owner:
+            future = url_checks[url] = Future()
+    if is_owner:
+        try:
+            future.set_result(check_url(url))
+        except Exception as e:
+            future.set_exception(e)
+    return future.result()
+
+
 def extract_version_from_url(url: str) -> str | None:
     """Extract version from binary archive URL."""
-    # GitHub releases: /download/v1.0.0/ or /releases/v1.0.0/
-    github_match = re.search(r"/(?:download|releases)/v?([\d.]+)/", url)
+    github_match = _GITHUB_RELEASE_VERSION_RE.search(url)
     if github_match:
         return normalize_version(github_match.group(1))
-    # npm tarballs: /-/package-1.0.0.tgz
-    npm_match = re.search(r"/-/[^/]+-(\d+\.\d+\.\d+)\.tgz", url)
+    npm_match = _NPM_TARBALL_VERSION_RE.search(url)
     if npm_match:
         return npm_match.group(1)
     return None
@@ -134,7 +287,7 @@ def validate_distribution_versions(agent_version: str, distribution: dict) -> li
             errors.append(f"uvx package uses '@latest' - use explicit version instead: {package}")
         # Extract version from uvx package
         # (formats: package==version, package>=version, package@version)
-        version_match = re.search(r"[=@]+([\d.]+)", package)
+        version_match = _UVX_VERSION_RE.search(package)
         if version_match:
             pkg_version = version_match.group(1)
             if pkg_version != agent_version:
@@ -146,42 +299,55 @@ def validate_distribution_versions(agent_version: str, distribution: dict) -> li
     return errors
 
 
-def validate_distribution_urls(distribution: dict) -> list[str]:
-    """Validate that distribution URLs exist."""
+def validate_distribution_urls(
+    distribution: dict, url_checks: dict[str, Future] | None = None
+) -> list[str]:
+    """Validate that distribution URLs exist.
+
+    The URLs of a distribution are checked concurrently, since each check is
+    dominated by network latency. Pass the same url_checks dict for every
+    agent in a build to probe each URL at most once per build.
+    """
     if SKIP_URL_VALIDATION:
         return []
 
-    errors = []
+    # (url, error reported if it is not accessible), in reporting order
+    checks: list[tuple[str, str]] = []
 
     # Check binary archive URLs
     if "binary" in distribution:
         for platform, target in distribution["binary"].items():
             if "archive" in target:
                 url = target["archive"]
-                if not url_exists(url):
-                    errors.append(f"Binary archive URL not accessible for {platform}: {url}")
+                checks.append((url, f"Binary archive URL not accessible for {platform}: {url}"))
 
     # Check npm package URLs (registry.npmjs.org)
-    seen_npm = set()
-    for dist_type in ("npx",):
-        if dist_type in distribution:
-            package = distribution[dist_type].get("package", "")
-            pkg_name = extract_npm_package_name(package)
-            if pkg_name and pkg_name not in seen_npm:
-                seen_npm.add(pkg_name)
-                npm_url = f"https://registry.npmjs.org/{pkg_name}"
-                if not url_exists(npm_url):
-                    errors.append(f"npm package not found: {pkg_name}")
+    if "npx" in distribution:
+        package = distribution["npx"].get("package", "")
+        pkg_name = extract_npm_package_name(package)
+        if pkg_name:
+            npm_url = f"https://registry.npmjs.org/{pkg_name}"
+            checks.append((npm_url, f"npm package not found: {pkg_name}"))
 
     # Check PyPI package URLs
     if "uvx" in distribution:
         package = distribution["uvx"].get("package", "")
         pkg_name = extract_pypi_package_name(package)
         pypi_url = f"https://pypi.org/pypi/{pkg_name}/json"
-        if not url_exists(pypi_url):
-            errors.append(f"PyPI package not found: {pkg_name}")
+        checks.append((pypi_url, f"PyPI package not found: {pkg_name}"))
 
-    return errors
+    if not checks:
+        return []
+
+    urls = list(dict.fromkeys(url for url, _ in checks))
+    with ThreadPoolExecutor(max_workers=min(URL_CHECK_WORKERS, len(urls))) as executor:
+        if url_checks is None:
+            results = executor.map(check_url, urls)
+        else:
+            results = executor.map(functools.partial(check_url_once, url_checks=url_checks), urls)
+        accessible = dict(zip(urls, results, strict=True))
+
+    return [error for url, error in checks if not accessible[url]]
 
 
 def validate_icon_monochrome(root: ET.Element) -> list[str]:
@@ -236,16 +402,12 @@ def validate_icon_monochrome(root: ET.Element) -> list[str]:
         # Check <style> elements for CSS rules with fill/stroke
         tag = elem.tag.split("}")[-1] if "}" in elem.tag else elem.tag
         if tag == "style" and elem.text:
-            for pattern, attr_name in (
-                (r"\bfill\s*:\s*([^;}\s]+)", "fill"),
-                (r"\bstroke\s*:\s*([^;}\s]+)", "stroke"),
-            ):
-                for val in re.findall(pattern, elem.text, re.IGNORECASE):
-                    val_lower = val.strip().lower()
-                    if val_lower == "currentcolor":
-                        has_current_color = True
-                    elif val_lower not in ALLOWED_FILL_STROKE_VALUES:
-                        errors.append(f"Icon has hardcoded CSS {attr_name}: {val.strip()}")
+            for attr_name, val in _CSS_FILL_STROKE_RE.findall(elem.text):
+                val_lower = val.lower()
+                if val_lower == "currentcolor":
+                    has_current_color = True
+                elif val_lower not in ALLOWED_FILL_STROKE_VALUES:
+                    errors.append(f"Icon has hardcoded CSS {attr_name.lower()}: {val}")
 
     if not has_current_color:
         errors.append("Icon must use currentColor for fills/strokes to support theming")
@@ -254,22 +416,29 @@ def validate_icon_monochrome(root: ET.Element) -> list[str]:
     return list(dict.fromkeys(errors))
 
 
+def _parse_svg_length(value: str) -> float | None:
+    """Parse an SVG length attribute such as "16" or "16px", ignoring the unit."""
+    try:
+        return float(_SVG_LENGTH_RE.fullmatch(value).group(1))
+    except ValueError:
+        return None
+
+
 def validate_icon(icon_path: Path) -> list[str]:
     """Validate icon.svg using an XML parser for robust SVG analysis."""
     errors = []
 
+    # Parse SVG as XML, feeding the parser from the file in chunks rather than
+    # materializing the whole document as a decoded string first
     try:
-        content = icon_path.read_text()
-    except Exception as e:
-        errors.append(f"Cannot read icon: {e}")
-        return errors
-
-    # Parse SVG as XML
-    try:
-        root = ET.fromstring(content)
+        with open(icon_path, "rb") as f:
+            root = ET.parse(f).getroot()
     except ET.ParseError as e:
         errors.append(f"Icon is not valid SVG/XML: {e}")
         return errors
+    except OSError as e:
+        errors.append(f"Cannot read icon: {e}")
+        return errors
 
     # Verify root element is <svg> (handle optional namespace)
     root_tag = root.tag.split("}")[-1] if "}" in root.tag else root.tag
@@ -286,11 +455,8 @@ def validate_icon(icon_path: Path) -> list[str]:
     vb_height = None
 
     if width_str and height_str:
-        try:
-            vb_width = float(re.sub(r"[a-z%]+$", "", width_str.strip(), flags=re.IGNORECASE))
-            vb_height = float(re.sub(r"[a-z%]+$", "", height_str.strip(), flags=re.IGNORECASE))
-        except ValueError:
-            pass
+        vb_width = _parse_svg_length(width_str)
+        vb_height = _parse_svg_length(height_str)
 
     if (vb_width is None or vb_height is None) and viewbox:
         parts = viewbox.split()
@@ -320,8 +486,58 @@ def validate_icon(icon_path: Path) -> list[str]:
     return errors
 
 
+def _icon_cache_version() -> int:
+    """Identify the validation rules; cached results are dropped when this script changes."""
+    return Path(__file__).stat().st_mtime_ns
+
+
+def load_icon_cache(path: Path) -> None:
+    """Load icon validation results saved by a previous build of the same script."""
+    try:
+        data = load_json(path)
+    except (json.JSONDecodeError, OSError):
+        return
+    if not isinstance(data, dict) or data.get("version") != _icon_cache_version():
+        return
+    icons = data.get("icons")
+    if isinstance(icons, dict):
+        _icon_cache.update(
+            {
+                path: result
+                for path, result in icons.items()
+                if isinstance(result, dict) and isinstance(result.get("errors"), list)
+            }
+        )
+
+
+def save_icon_cache(path: Path) -> None:
+    """Persist icon validation results for the next build."""
+    try:
+        write_json(path, {"version": _icon_cache_version(), "icons": _icon_cache})
+    except OSError as e:
+        print(f"Warning: Could not write icon cache {path}: {e}")
+
+
+def check_icon(icon_path: Path) -> list[str]:
+    """validate_icon(), reusing the cached result while the file's mtime and size are unchanged."""
+    if not ICON_CACHE_FILE:
+        return validate_icon(icon_path)
+    try:
+        st = icon_path.stat()
+    except OSError:
+        return validate_icon(icon_path)
+    key = str(icon_path)
+    cached = _icon_cache.get(key)
+    if cached and cached.get("mtime_ns") == st.st_mtime_ns and cached.get("size") == st.st_size:
+        return list(cached["errors"])
+    errors = validate_icon(icon_path)
+    _icon_cache[key] = {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "errors": errors}
+    return list(errors)
+
+
+@functools.lru_cache(maxsize=1)
 def get_base_url():
-    """Get base URL from environment or use default."""
+    """Get base URL from environment or use default (read once per process)."""
     return os.environ.get("REGISTRY_BASE_URL", DEFAULT_BASE_URL)
 
 
@@ -331,64 +547,90 @@ def load_schema(registry_dir: Path) -> dict | None:
     if not schema_path.exists():
         return None
     try:
-        with open(schema_path) as f:
-            return json.load(f)
+        return load_json(schema_path)
     except (json.JSONDecodeError, OSError) as e:
         print(f"Warning: Could not load agent.schema.json: {e}")
         return None
 
 
-def validate_against_schema(agent: dict, schema: dict) -> list[str]:
-    """Validate agent against JSON schema."""
-    if not HAS_JSONSCHEMA:
-        return []
+@dataclass(frozen=True)
+class SchemaValidator:
+    """Compiled agent schema, reused for every agent."""
+
+    validator: "jsonschema.protocols.Validator"
+    # fastjsonschema's generated validator, used to accept valid agents quickly
+    fast_validate: Callable[[dict], object] | None = None
+
+
+def create_schema_validator(schema: dict) -> SchemaValidator:
+    """Check schema once and return a validator that can be reused for every agent.
+
+    Raises jsonschema.SchemaError if the schema itself is invalid.
+    """
+    validator_cls = jsonschema.validators.validator_for(schema)
+    validator_cls.check_schema(schema)
+    fast_validate = None
+    if HAS_FASTJSONSCHEMA:
+        # jsonschema runs without a format checker, so formats are not asserted here either
+        fast_validate = fastjsonschema.compile(schema, use_formats=False)
+    return SchemaValidator(validator_cls(schema), fast_validate)
 
+
+def validate_against_schema(agent: dict, validator: SchemaValidator) -> list[str]:
+    """Validate agent against a validator from create_schema_validator()."""
     errors = []
-    try:
-        jsonschema.validate(instance=agent, schema=schema)
-    except jsonschema.ValidationError as e:
+    if validator.fast_validate is not None:
+        try:
+            validator.fast_validate(agent)
+            return errors
+        except fastjsonschema.JsonSchemaValueException:
+            # Fall through so that error messages come from jsonschema either way
+            pass
+
+    # Report the same single most relevant error that jsonschema.validate() raises
+    error = jsonschema.exceptions.best_match(validator.validator.iter_errors(agent))
+    if error is not None:
         # Get the path to the error
-        path = ".".join(str(p) for p in e.absolute_path) if e.absolute_path else "root"
-        errors.append(f"Schema validation error at '{path}': {e.message}")
-    except jsonschema.SchemaError as e:
-        errors.append(f"Invalid schema: {e.message}")
+        path = ".".join(str(p) for p in error.absolute_path) if error.absolute_path else "root"
+        errors.append(f"Schema validation error at '{path}': {error.message}")
 
     return errors
 
 
-def validate_agent(agent: dict, agent_dir: str, schema: dict | None = None) -> list[str]:
+def validate_agent(
+    agent: dict,
+    agent_dir: str,
+    schema_validator: SchemaValidator | None = None,
+) -> list[str]:
     """Validate agent.json and return list of errors."""
     errors = []
 
     # Validate against JSON schema first
-    if schema is not None:
-        schema_errors = validate_against_schema(agent, schema)
+    if schema_validator is not None:
+        schema_errors = validate_against_schema(agent, schema_validator)
         if schema_errors:
             errors.extend(schema_errors)
             return errors  # Return early if schema validation fails
 
     # Check required fields
-    missing = REQUIRED_FIELDS - set(agent.keys())
+    missing = REQUIRED_FIELDS - agent.keys()
     if missing:
         errors.append(f"Missing required fields: {', '.join(sorted(missing))}")
 
     # Validate id format
     if "id" in agent:
         agent_id = agent["id"]
-        if not agent_id:
-            errors.append("Field 'id' cannot be empty")
-        elif not agent_id[0].isalpha():
-            errors.append("Field 'id' must start with a letter")
-        elif not all(c.islower() or c.isdigit() or c == "-" for c in agent_id):
-            errors.append("Field 'id' must be lowercase with hyphens only")
+        if not _AGENT_ID_RE.fullmatch(agent_id):
+            errors.append(
+                "Field 'id' must be lowercase letters, digits and hyphens, starting with a letter"
+            )
         elif agent_id != agent_dir:
             errors.append(f"Field 'id' ({agent_id}) must match directory name ({agent_dir})")
 
     # Validate version format
     if "version" in agent:
         version = agent["version"]
-        parts = version.split(".")
-        if len(parts) < 3 or not all(p.isdigit() for p in parts[:3]):
+        if not _SEMVER_RE.match(version):
             errors.append(f"Field 'version' ({version}) must be semantic version (e.g., 1.0.0)")
 
     # Validate distribution
@@ -397,7 +639,7 @@ def validate_agent(agent: dict, agent_dir: str, schema: dict | None = None) -> l
         if not isinstance(dist, dict) or not dist:
             errors.append("Field 'distribution' must be a non-empty object")
         else:
-            unknown_types = set(dist.keys()) - VALID_DISTRIBUTION_TYPES
+            unknown_types = dist.keys() - VALID_DISTRIBUTION_TYPES
             if unknown_types:
                 errors.append(f"Unknown distribution types: {', '.join(sorted(unknown_types))}")
 
@@ -407,12 +649,14 @@ def validate_agent(agent: dict, agent_dir: str, schema: dict | None = None) -> l
                 if not isinstance(binary, dict) or not binary:
                     errors.append("Field 'distribution.binary' must be a non-empty object")
                 else:
-                    unknown_platforms = set(binary.keys()) - VALID_PLATFORMS
+                    unknown_platforms = binary.keys() - VALID_PLATFORMS
                     if unknown_platforms:
                         errors.append(f"Unknown platforms: {', '.join(sorted(unknown_platforms))}")
 
                     # Warn if not all OS families have at least one platform
-                    provided_os_families = {p.split("-")[0] for p in binary if p in VALID_PLATFORMS}
+                    provided_os_families = {
+                        _PLATFORM_TO_OS[p] for p in binary if p in _PLATFORM_TO_OS
+                    }
                     missing_os_families = REQUIRED_OS_FAMILIES - provided_os_families
                     if missing_os_families:
                         print(
@@ -422,22 +666,23 @@ def validate_agent(agent: dict, agent_dir: str, schema: dict | None = None) -> l
 
                     for platform, target in binary.items():
                         if platform in VALID_PLATFORMS:
-                            if "archive" not in target:
-                                errors.append(f"Platform {platform} missing 'archive' field")
-                            else:
+                            missing_keys = REQUIRED_BINARY_TARGET_FIELDS - target.keys()
+                            if missing_keys:
+                                errors.append(
+                                    f"Platform {platform} missing fields: "
+                                    f"{', '.join(sorted(missing_keys))}"
+                                )
+                            if "archive" in target:
                                 archive_url = target["archive"].lower()
-                                for ext in REJECTED_ARCHIVE_EXTENSIONS:
-                                    if archive_url.endswith(ext):
-                                        supported = ".zip, .tar.gz, .tgz, .tar.bz2, .tbz2"
-                                        errors.append(
-                                            f"Platform {platform} archive uses "
-                                            f"unsupported format '{ext}'. "
-                                            f"Supported formats: {supported}, "
-                                            f"or raw binaries"
-                                        )
-                                        break
-                            if "cmd" not in target:
-                                errors.append(f"Platform {platform} missing 'cmd' field")
+                                if archive_url.endswith(REJECTED_ARCHIVE_EXTENSIONS):
+                                    ext = archive_url[archive_url.rfind(".") :]
+                                    supported = ".zip, .tar.gz, .tgz, .tar.bz2, .tbz2"
+                                    errors.append(
+                                        f"Platform {platform} archive uses "
+                                        f"unsupported format '{ext}'. "
+                                        f"Supported formats: {supported}, "
+                                        f"or raw binaries"
+                                    )
 
             # Validate package distributions
             for dist_type in ("npx", "uvx"):
@@ -453,22 +698,25 @@ def process_entry(
     entry_dir: Path,
     entry_file: str,
     entry_type: str,
-    schema: dict | None,
+    schema_validator: SchemaValidator | None,
     base_url: str,
-    seen_ids: dict,
+    url_checks: dict[str, Future] | None = None,
 ) -> tuple[dict | None, list[str]]:
-    """Process a single registry entry. Returns (entry, errors)."""
+    """Process a single registry entry. Returns (entry, errors).
+
+    Safe to call concurrently for different entries; checks that span entries
+    (such as duplicate IDs) are left to the caller.
+    """
     entry_path = entry_dir / entry_file
 
     # Parse JSON with error handling
     try:
-        with open(entry_path) as f:
-            entry = json.load(f)
+        entry = load_json(entry_path)
     except json.JSONDecodeError as e:
         return None, [f"{entry_dir.name}/{entry_file} is invalid JSON: {e}"]
 
     # Validate entry
-    validation_errors = validate_agent(entry, entry_dir.name, schema)
+    validation_errors = validate_agent(entry, entry_dir.name, schema_validator)
     if validation_errors:
         return None, [f"{entry_dir.name}/{entry_file} validation failed:"] + [
             f"  - {e}" for e in validation_errors
@@ -482,17 +730,9 @@ def process_entry(
                 f"  - {e}" for e in version_errors
             ]
 
-    # Check for duplicate IDs
-    entry_id = entry["id"]
-    if entry_id in seen_ids:
-        return None, [
-            f"Duplicate ID '{entry_id}' in {entry_dir.name}/ (already in {seen_ids[entry_id]}/)"
-        ]
-    seen_ids[entry_id] = entry_dir.name
-
     # Validate distribution URLs
     if "distribution" in entry:
-        url_errors = validate_distribution_urls(entry["distribution"])
+        url_errors = validate_distribution_urls(entry["distribution"], url_checks)
         if url_errors:
             return None, [f"{entry_dir.name} distribution URL validation failed:"] + [
                 f"  - {e}" for e in url_errors
@@ -502,12 +742,12 @@ def process_entry(
     icon_path = entry_dir / "icon.svg"
     if not icon_path.exists():
         return None, [f"{entry_dir.name}/icon.svg is missing (icon is required)"]
-    icon_errors = validate_icon(icon_path)
+    icon_errors = check_icon(icon_path)
     if icon_errors:
         return None, [f"{entry_dir.name}/icon.svg validation failed:"] + [
             f"  - {e}" for e in icon_errors
         ]
-    entry["icon"] = f"{base_url}/{entry_id}.svg"
+    entry["icon"] = f"{base_url}/{entry['id']}.svg"
 
     return entry, []
 
@@ -521,33 +761,81 @@ def build_registry(dry_run: bool = False):
     registry_dir = Path(__file__).parent.parent.parent
     base_url = get_base_url()
     agents = []
-    seen_ids = {}
+    seen_ids: set[str] = set()
     has_errors = False
 
     # Load schema for validation
     schema = load_schema(registry_dir)
+    schema_validator = None
     if schema and not HAS_JSONSCHEMA:
         print("Warning: jsonschema not installed, skipping schema validation")
         print("  Install with: pip install jsonschema")
+    elif schema:
+        try:
+            schema_validator = create_schema_validator(schema)
+        except jsonschema.SchemaError as e:
+            print(f"Error: Invalid schema in agent.schema.json: {e.message}")
+            print("\nBuild failed due to validation errors")
+            sys.exit(1)
+
+    if URL_CACHE_FILE and not SKIP_URL_VALIDATION:
+        load_url_cache(Path(URL_CACHE_FILE))
+    if ICON_CACHE_FILE:
+        load_icon_cache(Path(ICON_CACHE_FILE))
+
+    # DirEntry caches the file type from readdir, so filtering needs no extra stat calls
+    with os.scandir(registry_dir) as it:
+        dir_entries = sorted(
+            (e for e in it if e.is_dir(follow_symlinks=False) and e.name not in SKIP_DIRS),
+            key=lambda e: e.name,
+        )
 
-    for entry_dir in sorted(registry_dir.iterdir()):
-        if not entry_dir.is_dir() or entry_dir.name in SKIP_DIRS:
-            continue
+    entry_dirs = [Path(e.path) for e in dir_entries]
+    # Shared by all agents so that a package or archive referenced by several
+    # agents is checked once per build
+    url_checks: dict[str, Future] = {}
 
-        agent_json_path = entry_dir / "agent.json"
+    def process(entry_dir: Path) -> tuple[dict | None, list[str]] | None:
+        if not (entry_dir / "agent.json").is_file():
+            return None
+        return process_entry(
+            entry_dir, "agent.json", "agent", schema_validator, base_url, url_checks
+        )
 
-        if not agent_json_path.exists():
-            print(f"Warning: {entry_dir.name}/ has no agent.json, skipping")
+    # Entries are independent, so validate them concurrently; results come back in
+    # directory order and are reported from this thread to keep output deterministic
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        results = list(executor.map(process, entry_dirs))
+
+    if URL_CACHE_FILE and not SKIP_URL_VALIDATION:
+        save_url_cache(Path(URL_CACHE_FILE))
+    if ICON_CACHE_FILE:
+        save_icon_cache(Path(ICON_CACHE_FILE))
+
+    # Collect the per-agent report and emit it in one write rather than a
+    # line-buffered write per print() when stdout is a CI pipe
+    report: list[str] = []
+    for entry_dir, result in zip(entry_dirs, results, strict=True):
+        if result is None:
+            report.append(f"Warning: {entry_dir.name}/ has no agent.json, skipping")
             continue
-
-        entry, errors = process_entry(entry_dir, "agent.json", "agent", schema, base_url, seen_ids)
+        entry, errors = result
+        if not errors:
+            # Check for duplicate IDs (validated IDs equal their directory names,
+            # so there is no separate "first seen in" directory to report)
+            entry_id = entry["id"]
+            if entry_id in seen_ids:
+                errors = [f"Duplicate agent ID '{entry_id}' in {entry_dir.name}/"]
+            else:
+                seen_ids.add(entry_id)
         if errors:
-            for error in errors:
-                print(f"Error: {error}")
+            report.extend(f"Error: {error}" for error in errors)
             has_errors = True
             continue
         agents.append(entry)
-        print(f"Added agent: {entry['id']} v{entry['version']}")
+        report.append(f"Added agent: {entry['id']} v{entry['version']}")
+    if report:
+        sys.stdout.write("\n".join(report) + "\n")
 
     if has_errors:
         print("\nBuild failed due to validation errors")
@@ -582,35 +870,36 @@ def build_registry(dry_run: bool = False):
 
     # Write registry.json
     registry = {"version": REGISTRY_VERSION, "agents": default_agents, "extensions": []}
-    output_path = dist_dir / "registry.json"
-    with open(output_path, "w") as f:
-        json.dump(registry, f, indent=2)
-        f.write("\n")
+    write_json(dist_dir / "registry.json", registry)
 
     # Write registry-for-jetbrains.json
     jetbrains_registry = {
         "version": REGISTRY_VERSION,
         "agents": jetbrains_agents,
     }
-    jetbrains_output_path = dist_dir / "registry-for-jetbrains.json"
-    with open(jetbrains_output_path, "w") as f:
-        json.dump(jetbrains_registry, f, indent=2)
-        f.write("\n")
+    write_json(dist_dir / "registry-for-jetbrains.json", jetbrains_registry)
 
-    # Copy icons to dist
+    # Link icons into dist (nothing writes to them afterwards), copying when
+    # hard links are not possible, e.g. when dist/ is on another filesystem.
+    # Every agent here passed icon validation, so its icon.svg is known to exist.
+    registry_root = str(registry_dir)
+    dist_root = str(dist_dir)
     for entry in agents:
         entry_id = entry["id"]
-        icon_src = registry_dir / entry_id / "icon.svg"
-        if icon_src.exists():
-            icon_dst = dist_dir / f"{entry_id}.svg"
-            icon_dst.write_bytes(icon_src.read_bytes())
+        icon_src = os.path.join(registry_root, entry_id, "icon.svg")
+        icon_dst = os.path.join(dist_root, f"{entry_id}.svg")
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(icon_dst)
+        try:
+            os.link(icon_src, icon_dst)
+        except OSError:
+            shutil.copyfile(icon_src, icon_dst)
 
     # Copy schema files to dist
     for schema_file in ("agent.schema.json", "registry.schema.json"):
         schema_src = registry_dir / schema_file
         if schema_src.exists():
-            schema_dst = dist_dir / schema_file
-            schema_dst.write_bytes(schema_src.read_bytes())
+            shutil.copyfile(schema_src, dist_dir / schema_file)
 
     print(f"\nBuilt dist/ with {len(agents)} total agents")
     print(
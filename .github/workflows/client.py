@@ -7,14 +7,18 @@ No SDK dependency - just raw JSON parsing to preserve _meta fields.
 
 import json
 import os
+import select
 import subprocess
 import tempfile
 import time
 from dataclasses import dataclass, field
 from pathlib import Path
 
+# Auth method types a client can act on
+VALID_AUTH_TYPES = frozenset({"agent", "terminal"})
 
-@dataclass
+
+@dataclass(slots=True)
 class AuthMethod:
     """Auth method with type inferred from _meta."""
 
@@ -24,7 +28,7 @@ class AuthMethod:
     description: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class AuthCheckResult:
     """Result of auth verification."""
 
@@ -80,14 +84,13 @@ def validate_auth_methods(auth_methods: list[AuthMethod]) -> tuple[bool, str]:
     if not auth_methods:
         return False, "No authMethods in response"
 
-    valid_types = {"agent", "terminal"}
-    methods_with_valid_type = [m for m in auth_methods if m.type in valid_types]
+    valid_count = sum(m.type in VALID_AUTH_TYPES for m in auth_methods)
 
-    if not methods_with_valid_type:
+    if not valid_count:
         types_found = [m.type for m in auth_methods]
         return False, f"No auth method with type 'agent' or 'terminal'. Found types: {types_found}"
 
-    return True, f"Found {len(methods_with_valid_type)} valid auth method(s)"
+    return True, f"Found {valid_count} valid auth method(s)"
 
 
 def send_jsonrpc(proc: subprocess.Popen, method: str, params: dict, msg_id: int = 1) -> None:
@@ -99,14 +102,12 @@ def send_jsonrpc(proc: subprocess.Popen, method: str, params: dict, msg_id: int
         "params": params,
     }
     message = json.dumps(request) + "\n"
-    proc.stdin.write(message)
+    proc.stdin.write(message.encode())
     proc.stdin.flush()
 
 
 def read_jsonrpc(proc: subprocess.Popen, timeout: float) -> dict | None:
     """Read a JSON-RPC response from the process (raw JSON, newline-delimited)."""
-    import select
-
     ready, _, _ = select.select([proc.stdout], [], [], timeout)
     if not ready:
         return None
@@ -117,9 +118,10 @@ def read_jsonrpc(proc: subprocess.Popen, timeout: float) -> dict | None:
 
     try:
         return json.loads(line)
-    except json.JSONDecodeError as e:
+    except (json.JSONDecodeError, UnicodeDecodeError) as e:
+        text = line.decode(errors="replace").rstrip()
         raise ValueError(
-            f"ACP spec violation: agent wrote non-JSON to stdout: {line.rstrip()!r}\n"
+            f"ACP spec violation: agent wrote non-JSON to stdout: {text!r}\n"
             f"Per the ACP spec, agents MUST NOT write anything to stdout "
             f"that is not a valid ACP message. "
             f"Diagnostic output should go to stderr."
@@ -132,17 +134,16 @@ def _collect_proc_diagnostics(proc: subprocess.Popen) -> tuple[str | None, int |
     Returns:
         (stderr_tail, exit_code) — either may be None if unavailable.
     """
-    import select
-
     exit_code = proc.poll()
 
     stderr_tail: str | None = None
     try:
         ready, _, _ = select.select([proc.stderr], [], [], 0.5)
         if ready:
+            # Unbuffered pipe: returns what is available instead of waiting for 8 KiB
             data = proc.stderr.read(8192)
             if data:
-                stderr_tail = data[-4000:]
+                stderr_tail = data.decode(errors="replace")[-4000:]
     except Exception:
         pass
 
@@ -167,10 +168,7 @@ def run_auth_check(
         AuthCheckResult with success status and auth methods
     """
     # Build isolated environment
-    full_env = os.environ.copy()
-    full_env["TERM"] = "dumb"
-    if env:
-        full_env.update(env)
+    full_env = {**os.environ, "TERM": "dumb", **(env or {})}
 
     # Use a temporary directory as HOME if not specified
     if "HOME" not in (env or {}):
@@ -182,8 +180,13 @@ def run_auth_check(
     try:
         # Make binary executable if needed
         exe_path = Path(cmd[0])
-        if exe_path.exists() and not os.access(exe_path, os.X_OK):
-            exe_path.chmod(exe_path.stat().st_mode | 0o755)
+        try:
+            st = exe_path.stat()
+        except OSError:
+            pass  # Not a path (e.g. "npx"); resolved via PATH when spawning
+        else:
+            if not st.st_mode & 0o111:
+                exe_path.chmod(st.st_mode | 0o755)
 
         # Start agent process
         proc = subprocess.Popen(
@@ -193,7 +196,6 @@ def run_auth_check(
             stdin=subprocess.PIPE,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
-            text=True,
             bufsize=0,
         )
 
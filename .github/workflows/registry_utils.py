@@ -1,49 +1,116 @@
 """Shared utilities for ACP registry scripts."""
 
+import functools
 import json
+import os
 import re
 import sys
+import threading
 from pathlib import Path
 
-SKIP_DIRS = {
-    ".claude",
-    ".git",
-    ".github",
-    ".idea",
-    "__pycache__",
-    "dist",
-    ".sandbox",
-    ".sparkle-space",
-    ".ruff_cache",
-}
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+SKIP_DIRS = frozenset(
+    {
+        ".claude",
+        ".git",
+        ".github",
+        ".idea",
+        "__pycache__",
+        "dist",
+        ".sandbox",
+        ".sparkle-space",
+        ".ruff_cache",
+    }
+)
+
+# Separates a PyPI package name from its version specifier
+_PYPI_SPEC_SEPARATOR_RE = re.compile(r"[<>=!@]")
+
+
+def parse_json(data: bytes | str):
+    """Parse a JSON document, using orjson when it is installed.
+
+    Raises json.JSONDecodeError (which orjson's error subclasses) on invalid JSON.
+    """
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def load_json(path: Path):
+    """Read and parse a JSON file, using orjson when it is installed.
+
+    Raises json.JSONDecodeError (which orjson's error subclasses) on invalid JSON.
+    """
+    with open(path, "rb") as f:
+        return parse_json(f.read())
+
+
+def dump_json(data) -> bytes:
+    """Serialize data as 2-space indented JSON with a trailing newline.
+
+    Uses orjson when it is installed; the output is identical to
+    json.dumps(data, indent=2) for ASCII-only content.
+    """
+    if HAS_ORJSON:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(data, indent=2) + "\n").encode()
+
+
+def write_json(path: Path, data) -> None:
+    """Write data as 2-space indented JSON with a trailing newline.
+
+    The document is serialized up front with dump_json() and written with a
+    single call instead of the many small writes json.dump() makes. It goes to
+    a temporary file that then replaces path, so an interrupted write never
+    leaves a truncated file behind and concurrent writers do not interleave.
+    """
+    payload = dump_json(data)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(payload)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+@functools.lru_cache(maxsize=512)
+def parse_npm_package_spec(package_spec: str) -> tuple[str, str | None]:
+    """Split npm spec like @scope/name@version into (name, version or None)."""
+    if package_spec.startswith("@"):
+        at = package_spec.find("@", 1)
+        if at < 0:
+            return package_spec, None
+        return package_spec[:at], package_spec[at + 1 :]
+    name, sep, rest = package_spec.partition("@")
+    return name, rest.partition("@")[0] if sep else None
 
 
 def extract_npm_package_name(package_spec: str) -> str:
     """Extract npm package name from spec like @scope/name@version."""
-    if package_spec.startswith("@"):
-        at_positions = [i for i, c in enumerate(package_spec) if c == "@"]
-        if len(at_positions) > 1:
-            return package_spec[: at_positions[1]]
-        return package_spec
-    return package_spec.split("@")[0]
+    return parse_npm_package_spec(package_spec)[0]
 
 
 def extract_npm_package_version(package_spec: str) -> str | None:
     """Extract version from npm package spec like @scope/name@version."""
-    if package_spec.startswith("@"):
-        at_positions = [i for i, c in enumerate(package_spec) if c == "@"]
-        if len(at_positions) > 1:
-            return package_spec[at_positions[1] + 1 :]
-        return None
-    parts = package_spec.split("@")
-    return parts[1] if len(parts) > 1 else None
+    return parse_npm_package_spec(package_spec)[1]
 
 
+@functools.lru_cache(maxsize=512)
 def extract_pypi_package_name(package_spec: str) -> str:
     """Extract PyPI package name from spec like package==version."""
-    return re.split(r"[<>=!@]", package_spec)[0]
+    return _PYPI_SPEC_SEPARATOR_RE.split(package_spec, maxsplit=1)[0]
 
 
+@functools.lru_cache(maxsize=512)
 def normalize_version(version: str) -> str:
     """Normalize version to semver format (x.y.z)."""
     parts = version.split(".")
@@ -62,8 +129,7 @@ def load_quarantine(registry_dir: Path) -> dict[str, str]:
     if not quarantine_path.exists():
         return {}
     try:
-        with open(quarantine_path) as f:
-            return json.load(f)
+        return load_json(quarantine_path)
     except (json.JSONDecodeError, OSError) as e:
         print(f"Warning: Could not read {quarantine_path}: {e}", file=sys.stderr)
         return {}
@@ -1,10 +1,311 @@
-"""Tests for build_registry icon validation and dry-run."""
+"""Tests for build_registry agent/icon validation and dry-run."""
 
 import tempfile
+import threading
+import time
+import urllib.error
+import urllib.request
 import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-from build_registry import validate_icon, validate_icon_monochrome
+import pytest
+
+import build_registry
+from build_registry import (
+    create_schema_validator,
+    load_schema,
+    validate_agent,
+    validate_distribution_urls,
+    validate_icon,
+    validate_icon_monochrome,
+)
+from registry_utils import write_json
+
+REGISTRY_DIR = Path(__file__).resolve().parents[3]
+
+# --- validate_agent ---
+
+
+def _agent(**overrides) -> dict:
+    agent = {
+        "id": "my-agent",
+        "name": "My Agent",
+        "version": "1.0.0",
+        "description": "Test agent",
+        "distribution": {"npx": {"package": "my-agent@1.0.0"}},
+    }
+    agent.update(overrides)
+    return agent
+
+
+class TestValidateAgent:
+    def test_valid(self):
+        assert validate_agent(_agent(), "my-agent") == []
+
+    def test_id_with_digits(self):
+        assert validate_agent(_agent(id="agent2"), "agent2") == []
+
+    def test_id_uppercase(self):
+        errors = validate_agent(_agent(id="My-Agent"), "My-Agent")
+        assert any("Field 'id' must be lowercase" in e for e in errors)
+
+    def test_id_starts_with_digit(self):
+        errors = validate_agent(_agent(id="2agent"), "2agent")
+        assert any("starting with a letter" in e for e in errors)
+
+    def test_id_empty(self):
+        errors = validate_agent(_agent(id=""), "")
+        assert any("Field 'id'" in e for e in errors)
+
+    def test_id_with_underscore(self):
+        errors = validate_agent(_agent(id="my_agent"), "my_agent")
+        assert any("Field 'id' must be lowercase" in e for e in errors)
+
+    def test_id_directory_mismatch(self):
+        errors = validate_agent(_agent(), "other-dir")
+        assert any("must match directory name" in e for e in errors)
+
+    def test_binary_target_missing_fields(self):
+        agent = _agent(distribution={"binary": {"linux-x86_64": {}}})
+        errors = validate_agent(agent, "my-agent")
+        assert "Platform linux-x86_64 missing fields: archive, cmd" in errors
+
+    def test_binary_target_missing_cmd(self):
+        agent = _agent(
+            distribution={"binary": {"linux-x86_64": {"archive": "https://x/a-1.0.0.tar.gz"}}}
+        )
+        errors = validate_agent(agent, "my-agent")
+        assert "Platform linux-x86_64 missing fields: cmd" in errors
+
+    def test_binary_rejected_archive_format(self):
+        binary = {"darwin-aarch64": {"archive": "https://x/v1.0.0/Agent.DMG", "cmd": "a"}}
+        errors = validate_agent(_agent(distribution={"binary": binary}), "my-agent")
+        assert len(errors) == 1
+        assert "unsupported format '.dmg'" in errors[0]
+
+    def test_version_with_extra_part(self):
+        assert validate_agent(_agent(version="1.2.3.4"), "my-agent") == []
+
+    def test_version_too_short(self):
+        errors = validate_agent(_agent(version="1.2"), "my-agent")
+        assert any("must be semantic version" in e for e in errors)
+
+    def test_version_non_numeric_patch(self):
+        errors = validate_agent(_agent(version="1.2.3-beta"), "my-agent")
+        assert any("must be semantic version" in e for e in errors)
+
+
+class TestSchemaValidation:
+    def _validator(self):
+        pytest.importorskip("jsonschema")
+        return create_schema_validator(load_schema(REGISTRY_DIR))
+
+    def test_valid_agent(self):
+        assert validate_agent(_agent(), "my-agent", self._validator()) == []
+
+    def test_validator_is_reusable(self):
+        validator = self._validator()
+        bad = _agent(distribution={"snap": {"package": "x"}})
+        assert validate_agent(bad, "my-agent", validator)
+        assert validate_agent(_agent(), "my-agent", validator) == []
+
+    def test_error_path_reported(self):
+        errors = validate_agent(_agent(name=""), "my-agent", self._validator())
+        assert len(errors) == 1
+        assert errors[0].startswith("Schema validation error at 'name':")
+
+    def test_fast_backend_matches_jsonschema(self, monkeypatch):
+        pytest.importorskip("fastjsonschema")
+        validator = self._validator()
+        assert validator.fast_validate is not None
+        bad = _agent(name="")
+        errors = validate_agent(bad, "my-agent", validator)
+        monkeypatch.setattr(build_registry, "HAS_FASTJSONSCHEMA", False)
+        slow = self._validator()
+        assert slow.fast_validate is None
+        assert validate_agent(bad, "my-agent", slow) == errors
+        # Formats are not asserted by either backend
+        assert validate_agent(_agent(repository="not a uri"), "my-agent", validator) == []
+
+    def test_invalid_schema_rejected(self):
+        jsonschema = pytest.importorskip("jsonschema")
+        with pytest.raises(jsonschema.SchemaError):
+            create_schema_validator({"type": 12})
+
+
+# --- validate_distribution_urls ---
+
+
+class TestValidateDistributionUrls:
+    @pytest.fixture
+    def checked(self, monkeypatch):
+        """Record checked URLs; URLs containing 'missing' are reported as absent."""
+        calls: list[str] = []
+
+        def fake_url_exists(url: str, **kwargs) -> bool:
+            calls.append(url)
+            return "missing" not in url
+
+        monkeypatch.setattr(build_registry, "SKIP_URL_VALIDATION", False)
+        monkeypatch.setattr(build_registry, "url_exists", fake_url_exists)
+        return calls
+
+    def test_all_accessible(self, checked):
+        dist = {
+            "binary": {
+                "linux-x86_64": {"archive": "https://x/v1.0.0/a-linux.tar.gz", "cmd": "a"},
+                "darwin-aarch64": {"archive": "https://x/v1.0.0/a-darwin.tar.gz", "cmd": "a"},
+            },
+            "npx": {"package": "@scope/pkg@1.0.0"},
+            "uvx": {"package": "pkg==1.0.0"},
+        }
+        assert validate_distribution_urls(dist) == []
+        assert sorted(checked) == [
+            "https://pypi.org/pypi/pkg/json",
+            "https://registry.npmjs.org/@scope/pkg",
+            "https://x/v1.0.0/a-darwin.tar.gz",
+            "https://x/v1.0.0/a-linux.tar.gz",
+        ]
+
+    def test_errors_in_distribution_order(self, checked):
+        dist = {
+            "binary": {
+                "linux-x86_64": {"archive": "https://x/missing-linux.tar.gz", "cmd": "a"},
+                "darwin-aarch64": {"archive": "https://x/ok-darwin.tar.gz", "cmd": "a"},
+                "windows-x86_64": {"archive": "https://x/missing-win.zip", "cmd": "a"},
+            },
+            "npx": {"package": "missing-pkg@1.0.0"},
+        }
+        assert validate_distribution_urls(dist) == [
+            "Binary archive URL not accessible for linux-x86_64: https://x/missing-linux.tar.gz",
+            "Binary archive URL not accessible for windows-x86_64: https://x/missing-win.zip",
+            "npm package not found: missing-pkg",
+        ]
+
+    def test_shared_archive_checked_once(self, checked):
+        url = "https://x/v1.0.0/universal.zip"
+        dist = {
+            "binary": {
+                "linux-x86_64": {"archive": url, "cmd": "a"},
+                "darwin-x86_64": {"archive": url, "cmd": "a"},
+            }
+        }
+        assert validate_distribution_urls(dist) == []
+        assert checked == [url]
+
+    def test_shared_url_checks_across_agents(self, checked):
+        url_checks = {}
+        dist = {"npx": {"package": "pkg@1.0.0"}, "uvx": {"package": "missing==1.0.0"}}
+        validate_distribution_urls(dist, url_checks)
+        # Failures are shared within a build as well; only the URL cache retries them
+        assert validate_distribution_urls(dist, url_checks) == ["PyPI package not found: missing"]
+        assert sorted(checked) == [
+            "https://pypi.org/pypi/missing/json",
+            "https://registry.npmjs.org/pkg",
+        ]
+
+    def test_url_checks_capped_across_agents(self, monkeypatch):
+        lock = threading.Lock()
+        active = peak = 0
+
+        def slow_url_exists(url: str, **kwargs) -> bool:
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.01)
+            with lock:
+                active -= 1
+            return True
+
+        monkeypatch.setattr(build_registry, "SKIP_URL_VALIDATION", False)
+        monkeypatch.setattr(build_registry, "url_exists", slow_url_exists)
+        dists = [
+            {
+                "binary": {
+                    platform: {"archive": f"https://x/{i}/{platform}.zip", "cmd": "a"}
+                    for platform in build_registry.VALID_PLATFORMS
+                }
+            }
+            for i in range(build_registry.MAX_WORKERS)
+        ]
+        url_checks = {}
+        with ThreadPoolExecutor(max_workers=len(dists)) as executor:
+            results = list(
+                executor.map(lambda dist: validate_distribution_urls(dist, url_checks), dists)
+            )
+        assert results == [[]] * len(dists)
+        assert 1 < peak <= build_registry.URL_CHECK_WORKERS
+
+    def test_url_cache_skips_recent_successes(self, checked, monkeypatch):
+        monkeypatch.setattr(build_registry, "URL_CACHE_FILE", "cache.json")
+        monkeypatch.setattr(build_registry, "_url_cache", {})
+        dist = {"npx": {"package": "pkg@1.0.0"}, "uvx": {"package": "missing==1.0.0"}}
+        validate_distribution_urls(dist)
+        validate_distribution_urls(dist)
+        # The success is cached; the failure is retried
+        assert sorted(checked) == [
+            "https://pypi.org/pypi/missing/json",
+            "https://pypi.org/pypi/missing/json",
+            "https://registry.npmjs.org/pkg",
+        ]
+
+    def test_url_cache_round_trip_drops_expired(self, monkeypatch):
+        monkeypatch.setattr(build_registry, "_url_cache", {})
+        with tempfile.TemporaryDirectory() as d:
+            path = Path(d) / "url-cache.json"
+            now = time.time()
+            write_json(
+                path,
+                {
+                    "https://fresh": {"checked_at": now - 60},
+                    "https://stale": {"checked_at": now - build_registry.URL_CACHE_TTL},
+                    "https://bare": now - 60,
+                },
+            )
+            build_registry.load_url_cache(path)
+            assert list(build_registry._url_cache) == ["https://fresh"]
+
+    def test_url_cache_keeps_validators_for_conditional_checks(self, monkeypatch):
+        monkeypatch.setattr(build_registry, "URL_CACHE_FILE", "cache.json")
+        old = time.time() - build_registry.URL_CACHE_TTL
+        monkeypatch.setattr(build_registry, "_url_cache", {})
+        with tempfile.TemporaryDirectory() as d:
+            path = Path(d) / "url-cache.json"
+            write_json(path, {"https://x/a.zip": {"checked_at": old, "etag": '"abc"'}})
+            build_registry.load_url_cache(path)
+
+        sent = []
+
+        def fake_urlopen(req, timeout):
+            sent.append(req.get_header("If-none-match"))
+            raise urllib.error.HTTPError(req.full_url, 304, "Not Modified", {}, None)
+
+        monkeypatch.setattr(urllib.request, "urlopen", fake_urlopen)
+        assert build_registry.check_url("https://x/a.zip")
+        assert sent == ['"abc"']
+        entry = build_registry._url_cache["https://x/a.zip"]
+        assert entry["checked_at"] > old
+        assert entry["etag"] == '"abc"'
+
+    def test_invalid_agent_not_probed(self, checked):
+        with tempfile.TemporaryDirectory() as d:
+            entry_dir = Path(d) / "my-agent"
+            entry_dir.mkdir()
+            write_json(entry_dir / "agent.json", _agent(version="1.0"))
+            entry, errors = build_registry.process_entry(
+                entry_dir, "agent.json", "agent", None, "https://example.com"
+            )
+        assert entry is None
+        assert errors[0] == "my-agent/agent.json validation failed:"
+        assert checked == []
+
+    def test_skipped(self, checked, monkeypatch):
+        monkeypatch.setattr(build_registry, "SKIP_URL_VALIDATION", True)
+        assert validate_distribution_urls({"npx": {"package": "missing@1.0.0"}}) == []
+        assert checked == []
+
 
 # --- validate_icon_monochrome ---
 
@@ -103,6 +404,15 @@ class TestValidateIconMonochrome:
         errors = validate_icon_monochrome(root)
         assert any("hardcoded CSS fill" in e for e in errors)
 
+    def test_style_element_fill_and_stroke(self):
+        root = self._root(
+            '<svg xmlns="http://www.w3.org/2000/svg">'
+            "<style>.a { STROKE: red; fill: currentColor }</style>"
+            '<path class="a" d="M0 0h16v16H0z"/>'
+            "</svg>"
+        )
+        assert validate_icon_monochrome(root) == ["Icon has hardcoded CSS stroke: red"]
+
     def test_style_element_current_color(self):
         root = self._root(
             '<svg xmlns="http://www.w3.org/2000/svg">'
@@ -210,6 +520,18 @@ class TestValidateIcon:
         errors = validate_icon(Path("/nonexistent/icon.svg"))
         assert any("Cannot read icon" in e for e in errors)
 
+    def test_non_utf8_encoding_declaration(self):
+        """Icons are parsed from raw bytes, so the XML declaration picks the encoding."""
+        with tempfile.TemporaryDirectory() as d:
+            p = Path(d) / "icon.svg"
+            p.write_bytes(
+                '<?xml version="1.0" encoding="ISO-8859-1"?>'
+                '<svg xmlns="http://www.w3.org/2000/svg" width="16" height="16">'
+                '<text fill="currentColor">caf\u00e9</text>'
+                "</svg>".encode("latin-1")
+            )
+            assert validate_icon(p) == []
+
     def test_width_with_px_unit(self):
         with tempfile.TemporaryDirectory() as d:
             p = self._write_icon(
@@ -219,3 +541,20 @@ class TestValidateIcon:
                 "</svg>",
             )
             assert validate_icon(p) == []
+
+    def test_icon_cache_reused_until_file_changes(self, monkeypatch):
+        monkeypatch.setattr(build_registry, "ICON_CACHE_FILE", "icon-cache.json")
+        monkeypatch.setattr(build_registry, "_icon_cache", {})
+        with tempfile.TemporaryDirectory() as d:
+            p = self._write_icon(
+                Path(d),
+                '<svg xmlns="http://www.w3.org/2000/svg" width="16" height="32">'
+                '<path fill="currentColor" d="M0 0z"/>'
+                "</svg>",
+            )
+            errors = build_registry.check_icon(p)
+            assert errors
+            build_registry._icon_cache[str(p)]["errors"] = ["cached"]
+            assert build_registry.check_icon(p) == ["cached"]
+            p.write_text("<svg/>")
+            assert build_registry.check_icon(p) != ["cached"]
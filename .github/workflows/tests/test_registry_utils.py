@@ -4,12 +4,18 @@ import json
 import tempfile
 from pathlib import Path
 
+import pytest
+
 from registry_utils import (
     extract_npm_package_name,
     extract_npm_package_version,
     extract_pypi_package_name,
+    load_json,
     load_quarantine,
     normalize_version,
+    parse_json,
+    parse_npm_package_spec,
+    write_json,
 )
 
 
@@ -44,6 +50,17 @@ class TestExtractNpmPackageVersion:
         assert extract_npm_package_version("some-package") is None
 
 
+class TestParseNpmPackageSpec:
+    def test_scoped_with_version(self):
+        assert parse_npm_package_spec("@scope/pkg@1.2.3") == ("@scope/pkg", "1.2.3")
+
+    def test_unscoped_without_version(self):
+        assert parse_npm_package_spec("some-package") == ("some-package", None)
+
+    def test_unscoped_extra_at_ignored(self):
+        assert parse_npm_package_spec("pkg@1.2.3@x") == ("pkg", "1.2.3")
+
+
 class TestExtractPypiPackageName:
     def test_with_double_equals(self):
         assert extract_pypi_package_name("some-package==1.2.3") == "some-package"
@@ -95,3 +112,39 @@ class TestLoadQuarantine:
             p = Path(d) / "quarantine.json"
             p.write_text("not json")
             assert load_quarantine(Path(d)) == {}
+
+
+class TestJsonHelpers:
+    def test_write_matches_stdlib_indent(self):
+        with tempfile.TemporaryDirectory() as d:
+            data = {"version": "1.0.0", "agents": [{"id": "a", "args": []}], "extensions": []}
+            p = Path(d) / "out.json"
+            write_json(p, data)
+            assert p.read_text() == json.dumps(data, indent=2) + "\n"
+
+    def test_round_trip(self):
+        with tempfile.TemporaryDirectory() as d:
+            data = {"id": "agent", "distribution": {"npx": {"package": "pkg@1.0.0"}}}
+            p = Path(d) / "agent.json"
+            write_json(p, data)
+            assert load_json(p) == data
+
+    def test_write_replaces_atomically(self):
+        with tempfile.TemporaryDirectory() as d:
+            p = Path(d) / "agent.json"
+            p.write_text('{"old": true}\n')
+            write_json(p, {"new": True})
+            assert load_json(p) == {"new": True}
+            assert [f.name for f in Path(d).iterdir()] == ["agent.json"]
+
+    def test_load_invalid_json_raises_decode_error(self):
+        with tempfile.TemporaryDirectory() as d:
+            p = Path(d) / "agent.json"
+            p.write_text("{not json")
+            with pytest.raises(json.JSONDecodeError):
+                load_json(p)
+
+    def test_parse_str_and_bytes(self):
+        assert parse_json('{"version": "1.0.0"}') == parse_json(b'{"version": "1.0.0"}')
+        with pytest.raises(json.JSONDecodeError):
+            parse_json("<html>")
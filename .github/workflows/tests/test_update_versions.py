@@ -0,0 +1,455 @@
+"""Tests for update_versions HTTP handling, release lookups and version rewriting."""
+
+import gzip
+import http.server
+import json
+import re
+import tempfile
+import threading
+import urllib.error
+from pathlib import Path
+
+import pytest
+
+import update_versions
+from registry_utils import load_json
+
+# --- _http_request / make_request ---
+
+
+class _Server:
+    """Local HTTP server answering from a path -> handler(request) table."""
+
+    def __init__(self, routes: dict):
+        self.requests: list[tuple[str, str, dict, int]] = []
+        server = self
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def _handle(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                if length:
+                    self.rfile.read(length)
+                server.requests.append(
+                    (self.command, self.path, dict(self.headers), self.client_address[1])
+                )
+                routes.get(self.path, _not_found)(self)
+
+            do_GET = do_POST = do_CONNECT = _handle
+
+        self._httpd = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.netloc = f"127.0.0.1:{self._httpd.server_port}"
+        self.url = f"http://{self.netloc}"
+        threading.Thread(
+            target=self._httpd.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True
+        ).start()
+
+    def close(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+
+def _respond(handler, status: int, body: bytes = b"", headers: dict | None = None):
+    handler.send_response(status)
+    for name, value in (headers or {}).items():
+        handler.send_header(name, value)
+    handler.send_header("Content-Length", str(len(body)))
+    handler.end_headers()
+    handler.wfile.write(body)
+
+
+def _not_found(handler):
+    _respond(handler, 404)
+
+
+def _json(data):
+    return lambda handler: _respond(handler, 200, json.dumps(data).encode())
+
+
+def _redirect(location: str, status: int = 301):
+    return lambda handler: _respond(handler, status, headers={"Location": location})
+
+
+class TestHttpRequest:
+    @pytest.fixture(autouse=True)
+    def isolated(self, monkeypatch):
+        """Fresh connections, no version cache and no proxies from the environment."""
+        monkeypatch.setattr(update_versions, "_thread_local", threading.local())
+        monkeypatch.setattr(update_versions, "USE_VERSION_CACHE", False)
+        for name in ("http_proxy", "https_proxy", "no_proxy", "all_proxy"):
+            monkeypatch.delenv(name, raising=False)
+            monkeypatch.delenv(name.upper(), raising=False)
+
+    @pytest.fixture
+    def servers(self):
+        started = []
+
+        def start(routes):
+            started.append(_Server(routes))
+            return started[-1]
+
+        yield start
+        for server in started:
+            server.close()
+
+    def test_follows_redirect_chain(self, servers):
+        target = servers({"/ok": _json({"version": "1.2.3"})})
+        server = servers(
+            {
+                "/a": _redirect("/b"),
+                "/b": _redirect("/c", 302),
+                "/c": _redirect(f"{target.url}/ok", 308),
+            }
+        )
+        assert update_versions.make_request(f"{server.url}/a") == {"version": "1.2.3"}
+        assert [path for _, path, _, _ in server.requests] == ["/a", "/b", "/c"]
+        assert [path for _, path, _, _ in target.requests] == ["/ok"]
+
+    def test_redirect_loop_raises(self, servers):
+        server = servers({"/loop": _redirect("/loop", 302)})
+        with pytest.raises(urllib.error.HTTPError) as e:
+            update_versions._http_request(f"{server.url}/loop", {})
+        assert e.value.code == 302
+        # The initial request plus the five redirects allowed
+        assert len(server.requests) == 6
+        assert update_versions.make_request(f"{server.url}/loop") is None
+
+    def test_cross_host_redirect_drops_authorization(self, servers):
+        other = servers({"/ok": _json({})})
+        server = servers(
+            {"/same": _redirect("/ok"), "/ok": _json({}), "/other": _redirect(f"{other.url}/ok")}
+        )
+        headers = {"Authorization": "token secret"}
+        update_versions._http_request(f"{server.url}/same", headers)
+        update_versions._http_request(f"{server.url}/other", headers)
+        # The same-host hop keeps the token; the hop to another host drops it
+        assert [r[2].get("Authorization") for r in server.requests] == ["token secret"] * 3
+        assert "Authorization" not in other.requests[0][2]
+
+    def test_see_other_after_post_switches_to_get(self, servers):
+        server = servers({"/submit": _redirect("/ok", 303), "/ok": _json({})})
+        status, _, _, _ = update_versions._http_request(
+            f"{server.url}/submit", {"Content-Type": "application/json"}, "POST", b"{}"
+        )
+        assert status == 200
+        method, path, headers, _ = server.requests[-1]
+        assert (method, path) == ("GET", "/ok")
+        assert "Content-Type" not in headers
+        assert "Content-Length" not in headers
+
+    def test_gzip_body(self, servers):
+        body = gzip.compress(json.dumps({"info": {"version": "2.0.0"}}).encode())
+        server = servers({"/pkg": lambda h: _respond(h, 200, body, {"Content-Encoding": "gzip"})})
+        assert update_versions.make_request(f"{server.url}/pkg") == {"info": {"version": "2.0.0"}}
+        assert server.requests[0][2]["Accept-Encoding"] == "gzip"
+
+    def test_not_found_returns_none(self, servers):
+        server = servers({})
+        assert update_versions.make_request(f"{server.url}/missing") is None
+
+    def test_server_error_raises(self, servers):
+        server = servers({"/boom": lambda h: _respond(h, 500)})
+        with pytest.raises(urllib.error.HTTPError):
+            update_versions.make_request(f"{server.url}/boom")
+
+    def test_keep_alive_reused(self, servers):
+        server = servers({"/ok": _json({})})
+        update_versions.make_request(f"{server.url}/ok")
+        update_versions.make_request(f"{server.url}/ok")
+        assert len({port for _, _, _, port in server.requests}) == 1
+
+    def test_retries_stale_keep_alive_connection(self, servers):
+        def respond_then_close(handler):
+            _json({"ok": True})(handler)
+            # Drop the connection without announcing it, as idle keep-alive timeouts do
+            handler.close_connection = True
+
+        server = servers({"/ok": respond_then_close})
+        assert update_versions.make_request(f"{server.url}/ok") == {"ok": True}
+        assert update_versions.make_request(f"{server.url}/ok") == {"ok": True}
+        assert len({port for _, _, _, port in server.requests}) == 2
+
+    def test_http_proxy(self, servers, monkeypatch):
+        proxy = servers({"http://example.invalid/pkg": _json({"via": "proxy"})})
+        monkeypatch.setenv("http_proxy", f"http://user:pass@{proxy.netloc}")
+        assert update_versions.make_request("http://example.invalid/pkg") == {"via": "proxy"}
+        _, path, headers, _ = proxy.requests[0]
+        assert path == "http://example.invalid/pkg"
+        assert headers["Proxy-Authorization"] == "Basic dXNlcjpwYXNz"
+
+    def test_no_proxy_bypasses_proxy(self, servers, monkeypatch):
+        proxy = servers({})
+        server = servers({"/ok": _json({})})
+        monkeypatch.setenv("http_proxy", proxy.url)
+        monkeypatch.setenv("no_proxy", "127.0.0.1")
+        assert update_versions.make_request(f"{server.url}/ok") == {}
+        assert proxy.requests == []
+
+    def test_https_proxy_tunnels(self, servers, monkeypatch):
+        proxy = servers({"example.invalid:443": lambda h: _respond(h, 502)})
+        monkeypatch.setenv("https_proxy", proxy.url)
+        # The proxy refuses the tunnel, which make_request reports as a failed lookup
+        assert update_versions.make_request("https://example.invalid/pkg") is None
+        assert proxy.requests[0][:2] == ("CONNECT", "example.invalid:443")
+
+
+# --- _TokenBucket ---
+
+
+class TestTokenBucket:
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        """Fake monotonic clock; sleeping advances it and is recorded."""
+        state = {"now": 100.0, "sleeps": []}
+
+        def sleep(seconds):
+            state["sleeps"].append(seconds)
+            state["now"] += seconds
+
+        monkeypatch.setattr(update_versions.time, "monotonic", lambda: state["now"])
+        monkeypatch.setattr(update_versions.time, "sleep", sleep)
+        return state
+
+    def test_burst_up_to_capacity(self, clock):
+        bucket = update_versions._TokenBucket(rate=2, capacity=3)
+        for _ in range(3):
+            bucket.acquire()
+        assert clock["sleeps"] == []
+        bucket.acquire()
+        assert clock["sleeps"] == [0.5]
+
+    def test_waiters_queue_behind_reservations(self, clock, monkeypatch):
+        bucket = update_versions._TokenBucket(rate=2, capacity=1)
+        bucket.acquire()
+        # Callers that find the bucket empty each reserve the next token, so
+        # concurrent waiters are spaced 1/rate apart instead of waking together
+        monkeypatch.setattr(update_versions.time, "sleep", clock["sleeps"].append)
+        bucket.acquire()
+        bucket.acquire()
+        assert clock["sleeps"] == [0.5, 1.0]
+
+    def test_refills_at_rate_up_to_capacity(self, clock):
+        bucket = update_versions._TokenBucket(rate=2, capacity=3)
+        for _ in range(3):
+            bucket.acquire()
+        clock["now"] += 1
+        bucket.acquire()
+        bucket.acquire()
+        assert clock["sleeps"] == []
+        clock["now"] += 60
+        for _ in range(3):
+            bucket.acquire()
+        assert clock["sleeps"] == []
+        bucket.acquire()
+        assert clock["sleeps"] == [0.5]
+
+    def test_make_request_limits_known_hosts(self, monkeypatch):
+        acquired = []
+
+        class Bucket:
+            def __init__(self, host):
+                self.host = host
+
+            def acquire(self):
+                acquired.append(self.host)
+
+        monkeypatch.setattr(update_versions, "USE_VERSION_CACHE", False)
+        monkeypatch.setattr(update_versions, "_RATE_LIMITS", {"pypi.org": Bucket("pypi.org")})
+        monkeypatch.setattr(
+            update_versions, "_http_request", lambda url, headers: (200, "OK", {}, b"{}")
+        )
+        update_versions.make_request("https://pypi.org/pypi/agent/json")
+        update_versions.make_request("https://example.com/agent.json")
+        assert acquired == ["pypi.org"]
+
+
+# --- prefetch_github_releases ---
+
+_ALIAS_RE = re.compile(r'(r\d+): repository\(owner: "([^"]*)", name: "([^"]*)"\)')
+
+
+class TestPrefetchGithubReleases:
+    @pytest.fixture
+    def graphql(self, monkeypatch):
+        """Answer GraphQL queries from a (owner, repo) -> repository table; record queries."""
+        monkeypatch.setenv("GITHUB_TOKEN", "token")
+        monkeypatch.setattr(update_versions, "_github_releases", {})
+        unlimited = update_versions._TokenBucket(rate=1e6, capacity=1000)
+        monkeypatch.setattr(update_versions, "_RATE_LIMITS", {"api.github.com": unlimited})
+        state = {"queries": [], "repositories": {}, "fail": set(), "errors": None}
+
+        def fake_http_request(url, headers, method="GET", body=None, redirects=5):
+            assert (url, method) == ("https://api.github.com/graphql", "POST")
+            assert headers["Authorization"] == "bearer token"
+            aliases = _ALIAS_RE.findall(json.loads(body)["query"])
+            state["queries"].append([(owner, repo) for _, owner, repo in aliases])
+            if len(state["queries"]) in state["fail"]:
+                return 502, "Bad Gateway", {}, b""
+            data = {alias: state["repositories"].get((o, r)) for alias, o, r in aliases}
+            response = {"data": data}
+            if state["errors"]:
+                response["errors"] = state["errors"]
+            return 200, "OK", {}, json.dumps(response).encode()
+
+        monkeypatch.setattr(update_versions, "_http_request", fake_http_request)
+        return state
+
+    @staticmethod
+    def _release(tag: str, *assets: str) -> dict:
+        return {
+            "latestRelease": {
+                "tagName": tag,
+                "releaseAssets": {"nodes": [{"name": a} for a in assets]},
+            }
+        }
+
+    def test_without_token_does_nothing(self, graphql, monkeypatch):
+        monkeypatch.delenv("GITHUB_TOKEN")
+        update_versions.prefetch_github_releases(["https://github.com/o/r"])
+        assert graphql["queries"] == []
+        assert update_versions._github_releases == {}
+
+    def test_batches_of_fifty_deduplicated(self, graphql):
+        urls = [f"https://github.com/o/repo{i}" for i in range(120)]
+        # Same repository in other spellings, and a URL that is not GitHub
+        urls += ["https://github.com/O/Repo0", "https://github.com/o/repo1.git", "https://x/y"]
+        graphql["repositories"] = {("o", f"repo{i}"): self._release(f"v1.{i}") for i in range(120)}
+        update_versions.prefetch_github_releases(urls)
+        assert [len(q) for q in graphql["queries"]] == [50, 50, 20]
+        assert len(update_versions._github_releases) == 120
+        assert update_versions._github_releases[("o", "repo7")] == ("1.7.0", [])
+
+    def test_prefetched_release_skips_rest(self, graphql, monkeypatch):
+        graphql["repositories"] = {("o", "r"): self._release("v2.0.1", "r-linux.tar.gz")}
+        update_versions.prefetch_github_releases(["https://github.com/o/r"])
+        monkeypatch.setattr(update_versions, "make_request", pytest.fail)
+        assert update_versions.get_github_latest_release("https://github.com/O/R") == (
+            "2.0.1",
+            ["r-linux.tar.gz"],
+        )
+
+    def test_partial_errors(self, graphql, monkeypatch):
+        graphql["repositories"] = {
+            ("o", "found"): self._release("v1.0.0"),
+            ("o", "unreleased"): {"latestRelease": None},
+        }
+        graphql["errors"] = [{"type": "NOT_FOUND", "path": ["r1"]}]
+        update_versions.prefetch_github_releases(
+            [
+                "https://github.com/o/found",
+                "https://github.com/o/missing",
+                "https://github.com/o/unreleased",
+            ]
+        )
+        assert update_versions._github_releases == {
+            ("o", "found"): ("1.0.0", []),
+            ("o", "unreleased"): (None, []),
+        }
+        # The unresolved repository is looked up over REST instead
+        rest = []
+        monkeypatch.setattr(update_versions, "make_request", lambda url: rest.append(url))
+        for name in ("missing", "unreleased"):
+            assert update_versions.get_github_latest_release(f"https://github.com/o/{name}") == (
+                None,
+                [],
+            )
+        assert rest == ["https://api.github.com/repos/o/missing/releases/latest"]
+
+    def test_failed_batch_left_to_rest(self, graphql, capsys):
+        urls = [f"https://github.com/o/repo{i}" for i in range(60)]
+        graphql["repositories"] = {("o", f"repo{i}"): self._release("v1.0.0") for i in range(60)}
+        graphql["fail"] = {1}
+        update_versions.prefetch_github_releases(urls)
+        assert len(graphql["queries"]) == 2
+        # Only the second batch was resolved
+        assert sorted(update_versions._github_releases) == [
+            ("o", f"repo{i}") for i in range(50, 60)
+        ]
+        assert "GitHub GraphQL lookup failed: 502 Bad Gateway" in capsys.readouterr().err
+
+
+# --- apply_update ---
+
+
+def _apply(old: str, new: str, agent: dict) -> dict:
+    """Run apply_update on agent (at version old) and return what was written."""
+    agent = {"id": "agent", "version": old, **agent}
+    with tempfile.TemporaryDirectory() as d:
+        path = Path(d) / "agent.json"
+        update = update_versions.VersionUpdate("agent", path, old, new, "binary", "", agent)
+        assert update_versions.apply_update(update)
+        return load_json(path)
+
+
+def _rewrite(old: str, new: str, url: str) -> str:
+    agent = {"distribution": {"binary": {"linux-x86_64": {"archive": url, "cmd": "./a"}}}}
+    return _apply(old, new, agent)["distribution"]["binary"]["linux-x86_64"]["archive"]
+
+
+class TestApplyUpdate:
+    def test_package_specs(self):
+        agent = _apply(
+            "1.2.3",
+            "1.3.0",
+            {
+                "distribution": {
+                    "npx": {"package": "@scope/agent@1.2.3"},
+                    "uvx": {"package": "agent==1.2.3"},
+                }
+            },
+        )
+        assert agent["version"] == "1.3.0"
+        assert agent["distribution"]["npx"]["package"] == "@scope/agent@1.3.0"
+        assert agent["distribution"]["uvx"]["package"] == "agent==1.3.0"
+
+    @pytest.mark.parametrize(
+        ("url", "expected"),
+        [
+            # GitHub release with a v-prefixed tag and the version in the file name
+            (
+                "https://github.com/o/r/releases/download/v1.2.3/agent-1.2.3-linux.tar.gz",
+                "https://github.com/o/r/releases/download/v2.0.0/agent-2.0.0-linux.tar.gz",
+            ),
+            (
+                "https://example.com/1.2.3/agent_1.2.3_linux.zip",
+                "https://example.com/2.0.0/agent_2.0.0_linux.zip",
+            ),
+            ("https://example.com/agent_1.2.3.zip", "https://example.com/agent_2.0.0.zip"),
+            # Not delimited, so not a version to replace
+            (
+                "https://example.com/agent11.2.3/a1.2.3.zip",
+                "https://example.com/agent11.2.3/a1.2.3.zip",
+            ),
+            ("https://example.com/v1.2.3.zip", "https://example.com/v1.2.3.zip"),
+        ],
+    )
+    def test_full_version_in_url(self, url, expected):
+        assert _rewrite("1.2.3", "2.0.0", url) == expected
+
+    def test_short_version_in_url(self):
+        url = "https://example.com/1.6/agent-1.6-linux.zip"
+        assert _rewrite("1.6.0", "1.7.0", url) == "https://example.com/1.7/agent-1.7-linux.zip"
+
+    def test_short_version_skipped_when_full_version_replaced(self):
+        url = "https://example.com/v2.2.0/agent-2.2.zip"
+        assert _rewrite("2.2.0", "2.2.1", url) == "https://example.com/v2.2.1/agent-2.2.zip"
+
+    @pytest.mark.parametrize(
+        ("url", "expected"),
+        [
+            # One pass per delimiter pair, each non-overlapping: an occurrence whose
+            # leading delimiter ended the previous match of the same pair is kept
+            ("https://h/v1.0.0/v1.0.0/a.zip", "https://h/v2.0.0/v1.0.0/a.zip"),
+            ("https://h/1.0.0/1.0.0/a.zip", "https://h/2.0.0/1.0.0/a.zip"),
+            ("https://h/a-1.0.0-1.0.0-x.zip", "https://h/a-2.0.0-1.0.0-x.zip"),
+            # ...but replaced when a later pair matches it
+            ("https://h/v1.0.0/1.0.0/a.zip", "https://h/v2.0.0/2.0.0/a.zip"),
+            ("https://h/a-1.0.0-1.0.0.zip", "https://h/a-2.0.0-2.0.0.zip"),
+        ],
+    )
+    def test_adjacent_versions_in_url(self, url, expected):
+        assert _rewrite("1.0.0", "2.0.0", url) == expected
@@ -0,0 +1,158 @@
+"""Tests for verify_agents downloads, extraction and launch probing."""
+
+import http.server
+import os
+import re
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+import verify_agents
+
+# --- download_file ---
+
+BODY = os.urandom(5000)
+
+
+class TestDownloadFile:
+    @pytest.fixture
+    def server(self, monkeypatch):
+        """Serve BODY at /file, advertising byte ranges; honour_ranges decides if they work."""
+        monkeypatch.setattr(verify_agents, "RANGE_CHUNK_SIZE", 1024)
+        monkeypatch.setattr(verify_agents, "DOWNLOAD_CHUNK_SIZE", 256)
+        state = {"honour_ranges": True, "ranges": []}
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                match = re.fullmatch(r"bytes=(\d+)-(\d+)", self.headers.get("Range") or "")
+                if match and state["honour_ranges"]:
+                    start, end = int(match[1]), int(match[2])
+                    state["ranges"].append((start, end))
+                    body = BODY[start : end + 1]
+                    self.send_response(206)
+                    self.send_header("Content-Range", f"bytes {start}-{end}/{len(BODY)}")
+                else:
+                    body = BODY
+                    self.send_response(200)
+                self.send_header("Accept-Ranges", "bytes")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        httpd = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(
+            target=httpd.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True
+        ).start()
+        state["url"] = f"http://127.0.0.1:{httpd.server_port}/file"
+        yield state
+        httpd.shutdown()
+        httpd.server_close()
+
+    @pytest.mark.skipif(not hasattr(os, "pwrite"), reason="ranged downloads need os.pwrite")
+    def test_ranges_reassembled(self, server):
+        with tempfile.TemporaryDirectory() as d:
+            dest = Path(d) / "agent.tar.gz"
+            assert verify_agents.download_file(server["url"], dest)
+            assert dest.read_bytes() == BODY
+            assert [p.name for p in Path(d).iterdir()] == ["agent.tar.gz"]
+        assert len(server["ranges"]) == 5
+
+    def test_ignored_ranges_fall_back_to_single_get(self, server):
+        server["honour_ranges"] = False
+        with tempfile.TemporaryDirectory() as d:
+            dest = Path(d) / "agent.tar.gz"
+            assert verify_agents.download_file(server["url"], dest)
+            assert dest.read_bytes() == BODY
+            assert [p.name for p in Path(d).iterdir()] == ["agent.tar.gz"]
+
+
+# --- extract_archive ---
+
+
+def test_raw_binary_not_shared_with_archive():
+    with tempfile.TemporaryDirectory() as d:
+        archive = Path(d) / "agent-linux-x64"
+        archive.write_bytes(b"\x7fELF")
+        archive.chmod(0o644)
+        dest = Path(d) / "extracted"
+        dest.mkdir()
+        assert verify_agents.extract_archive(archive, dest)
+        extracted = dest / archive.name
+        extracted.chmod(0o755)
+        extracted.write_bytes(b"updated")
+        assert not extracted.samefile(archive)
+        assert archive.read_bytes() == b"\x7fELF"
+        assert archive.stat().st_mode & 0o777 == 0o644
+
+
+# --- run_process ---
+
+# Fake agents, run with the current interpreter
+ANSWERS = (
+    "import sys, time; sys.stdin.readline(); "
+    'print(\'{"jsonrpc": "2.0", "id": 1, "result": {}}\', flush=True); time.sleep(60)'
+)
+SILENT = "import time; time.sleep(60)"
+FAILS = "import sys; print('boom', file=sys.stderr); sys.exit(3)"
+EXITS_ON_EOF = "import sys; sys.stdin.read()"
+
+
+class TestRunProcess:
+    @pytest.fixture(autouse=True)
+    def short_reply_window(self, monkeypatch):
+        monkeypatch.setattr(verify_agents, "ACP_REPLY_WINDOW", 0.2)
+
+    def _run(self, code: str, timeout: int = 10) -> tuple[tuple[int | None, str, str], float]:
+        started = time.monotonic()
+        with tempfile.TemporaryDirectory() as d:
+            result = verify_agents.run_process([sys.executable, "-c", code], Path(d), {}, timeout)
+        return result, time.monotonic() - started
+
+    def test_answering_agent_stopped_early(self):
+        (exit_code, stdout, stderr), elapsed = self._run(ANSWERS)
+        assert exit_code is None
+        assert stderr == verify_agents.ACP_ANSWERED
+        assert '"id": 1' in stdout
+        assert elapsed < 5
+
+    def test_silent_agent_runs_until_timeout(self):
+        (exit_code, _, stderr), elapsed = self._run(SILENT, timeout=1)
+        assert exit_code is None
+        assert stderr == "(process was still running - terminated)"
+        assert elapsed >= 1
+
+    def test_failing_agent_reports_exit_code(self):
+        (exit_code, _, stderr), _ = self._run(FAILS)
+        assert exit_code == 3
+        assert "boom" in stderr
+
+    def test_agent_exiting_on_eof_finishes_before_timeout(self):
+        (exit_code, _, _), elapsed = self._run(EXITS_ON_EOF)
+        assert exit_code == 0
+        assert elapsed < 5
+
+    def test_environment_read_at_launch(self, monkeypatch):
+        monkeypatch.setenv("ACP_TEST_LATE", "late")
+        code = "import os; print(os.environ.get('ACP_TEST_LATE'), os.environ.get('ACP_TEST_AGENT'))"
+        with tempfile.TemporaryDirectory() as d:
+            plain = verify_agents.run_process([sys.executable, "-c", code], Path(d), {}, 10)
+            layered = verify_agents.run_process(
+                [sys.executable, "-c", code], Path(d), {"ACP_TEST_AGENT": "agent"}, 10
+            )
+        assert plain[:2] == (0, "late None\n")
+        assert layered[:2] == (0, "late agent\n")
+
+    def test_command_not_found(self):
+        with tempfile.TemporaryDirectory() as d:
+            exit_code, _, stderr = verify_agents.run_process(
+                [str(Path(d) / "missing")], Path(d), {}, 1
+            )
+        assert exit_code == -1
+        assert stderr.startswith("Command not found")
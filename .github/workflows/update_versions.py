@@ -14,27 +14,47 @@ Usage:
 
 Environment variables:
     GITHUB_TOKEN: GitHub token for API requests (increases rate limit)
+    ACP_VERSION_CACHE: Set to 1 to cache responses in .github/workflows/.version_cache
+        and revalidate them with ETags on later runs; parsed agent.json files are
+        cached there too, keyed by path and reused while mtime and size match
+    ACP_LAST_CHECKED_TTL: Seconds during which an agent found up to date is not
+        checked again, as long as its version is unchanged (default: 0, always check);
+        needs ACP_VERSION_CACHE, as the check times are kept in the same directory
 """
 
 import argparse
+import base64
+import functools
+import gzip
+import hashlib
+import http.client
 import json
 import os
 import re
 import sys
+import threading
+import time
 import urllib.error
+import urllib.parse
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import NamedTuple
 
 from registry_utils import (
     SKIP_DIRS,
+    dump_json,
     extract_npm_package_name,
     extract_pypi_package_name,
+    load_json,
     load_quarantine,
+    parse_json,
+    write_json,
 )
 
 
-class VersionUpdate(NamedTuple):
+@dataclass(slots=True)
+class VersionUpdate:
     """Represents a version update for an agent."""
 
     agent_id: str
@@ -43,9 +63,11 @@ class VersionUpdate(NamedTuple):
     latest_version: str
     distribution_type: str  # 'npx', 'uvx', 'binary', or combined like 'binary+npx'
     source_url: str  # URL where version was fetched from
+    agent_data: dict | None = None  # Parsed agent.json, reused by apply_update
 
 
-class UpdateError(NamedTuple):
+@dataclass(slots=True)
+class UpdateError:
     """Represents an error during version checking."""
 
     agent_id: str
@@ -57,15 +79,221 @@ AGENT_DIRS = [
     ".",  # Root directory (active agents)
 ]
 
+# Version lookups are network-bound, so check several agents at once
+MAX_WORKERS = 16
+
+# owner/repo from a GitHub repository URL
+_GITHUB_REPO_RE = re.compile(r"github\.com/([^/]+)/([^/]+)")
+# Release tags with only major.minor, normalized to x.y.0
+_SHORT_VERSION_RE = re.compile(r"^\d+\.\d+$")
+# Version part of a uvx spec: package==1.0.0, package@1.0.0
+_UVX_VERSION_RE = re.compile(r"([=@]+)[\d.]+")
+_TRAILING_ZERO_RE = re.compile(r"\.0$")
+
+# Opt-in on-disk cache of registry responses, revalidated with ETags on each run
+USE_VERSION_CACHE = os.environ.get("ACP_VERSION_CACHE", "").lower() in ("1", "true", "yes")
+VERSION_CACHE_DIR = Path(__file__).parent / ".version_cache"
+# How long a cached 404 is trusted before the URL is requested again
+NEGATIVE_CACHE_TTL = 10 * 60  # seconds
+# Agents found up to date: id -> {"version", "checked_at"}, trusted for LAST_CHECKED_TTL seconds
+LAST_CHECKED_FILE = VERSION_CACHE_DIR / "last_checked.json"
+try:
+    LAST_CHECKED_TTL = int(os.environ.get("ACP_LAST_CHECKED_TTL", "0")) if USE_VERSION_CACHE else 0
+except ValueError:
+    print(
+        "Warning: ACP_LAST_CHECKED_TTL must be a whole number of seconds; ignoring it",
+        file=sys.stderr,
+    )
+    LAST_CHECKED_TTL = 0
+# Parsed agent.json files keyed by path, reused while their mtime and size are unchanged
+AGENTS_INDEX_FILE = VERSION_CACHE_DIR / "agents_index.json"
+
+# Repositories looked up per GitHub GraphQL query
+GITHUB_GRAPHQL_BATCH_SIZE = 50
+
+# (owner, repo) in lowercase -> (version, asset names), filled by prefetch_github_releases()
+_github_releases: dict[tuple[str, str], tuple[str | None, list[str]]] = {}
+
+# Holds each worker thread's keep-alive connections, keyed by (scheme, host)
+_thread_local = threading.local()
+
+
+class _TokenBucket:
+    """Thread-safe token bucket allowing bursts of capacity requests, refilled at rate/s."""
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.last = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Take one token, sleeping until one is available."""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+            self.last = now
+            # Reserve the token now; callers that drive it negative wait their turn
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        if wait:
+            time.sleep(wait)
+
+
+# Per-host request rates, so concurrent checks do not trip registry rate limits
+_RATE_LIMITS = {
+    "api.github.com": _TokenBucket(rate=5, capacity=10),
+    "registry.npmjs.org": _TokenBucket(rate=10, capacity=20),
+    "pypi.org": _TokenBucket(rate=10, capacity=20),
+}
+
 
 def get_github_token() -> str | None:
     """Get GitHub token from environment."""
     return os.environ.get("GITHUB_TOKEN")
 
 
+def _get_proxy(scheme: str, host: str) -> urllib.parse.SplitResult | None:
+    """Return the proxy from HTTPS_PROXY/HTTP_PROXY for scheme, unless NO_PROXY covers host."""
+    proxy = urllib.request.getproxies().get(scheme)
+    if not proxy or urllib.request.proxy_bypass(host):
+        return None
+    if "://" not in proxy:
+        proxy = f"http://{proxy}"
+    return urllib.parse.urlsplit(proxy)
+
+
+def _proxy_headers(proxy: urllib.parse.SplitResult) -> dict[str, str]:
+    """Proxy-Authorization for credentials given in the proxy URL, as urllib sends it."""
+    if proxy.username is None:
+        return {}
+    user = urllib.parse.unquote(proxy.username)
+    password = urllib.parse.unquote(proxy.password or "")
+    credentials = base64.b64encode(f"{user}:{password}".encode()).decode()
+    return {"Proxy-Authorization": f"Basic {credentials}"}
+
+
+def _get_connection(scheme: str, host: str) -> http.client.HTTPConnection:
+    """Return this thread's keep-alive connection to host, opening it on first use.
+
+    HTTPS goes through a CONNECT tunnel when a proxy is configured; plain HTTP
+    connects to the proxy itself and _http_request sends it the full URL.
+    """
+    connections = _thread_local.__dict__.setdefault("connections", {})
+    conn = connections.get((scheme, host))
+    if conn is None:
+        conn_cls = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        proxy = _get_proxy(scheme, host)
+        if proxy is None:
+            conn = conn_cls(host, timeout=30)
+        else:
+            conn = conn_cls(proxy.netloc.rpartition("@")[2], timeout=30)
+            if scheme == "https":
+                conn.set_tunnel(host, headers=_proxy_headers(proxy))
+        connections[(scheme, host)] = conn
+    return conn
+
+
+def _http_request(
+    url: str,
+    headers: dict,
+    method: str = "GET",
+    body: bytes | None = None,
+    redirects: int = 5,
+) -> tuple[int, str, http.client.HTTPMessage, bytes]:
+    """Send a request over a reused connection, following up to `redirects` redirects.
+
+    Proxies are taken from HTTPS_PROXY, HTTP_PROXY and NO_PROXY like urllib does.
+    303 responses, and 301/302 answering a POST, are followed with a GET.
+    Raises urllib.error.HTTPError if the redirect limit is reached.
+
+    Returns (status, reason, response headers, body).
+    """
+    parts = urllib.parse.urlsplit(url)
+    path = parts.path or "/"
+    if parts.query:
+        path = f"{path}?{parts.query}"
+    request_headers = headers
+    proxy = _get_proxy("http", parts.netloc) if parts.scheme == "http" else None
+    if proxy:
+        path = urllib.parse.urlunsplit(parts._replace(fragment=""))
+        request_headers = {**headers, **_proxy_headers(proxy)}
+
+    for attempt in range(2):
+        conn = _get_connection(parts.scheme, parts.netloc)
+        try:
+            conn.request(method, path, body=body, headers=request_headers)
+            response = conn.getresponse()
+            content = response.read()
+            break
+        except (http.client.HTTPException, OSError):
+            # The server may have closed an idle keep-alive connection; retry once
+            conn.close()
+            if attempt:
+                raise
+
+    location = response.getheader("Location")
+    if response.status in (301, 302, 303, 307, 308) and location:
+        if not redirects:
+            raise urllib.error.HTTPError(
+                url, response.status, "Too many redirects", response.headers, None
+            )
+        next_url = urllib.parse.urljoin(url, location)
+        if urllib.parse.urlsplit(next_url).netloc != parts.netloc:
+            headers = {k: v for k, v in headers.items() if k != "Authorization"}
+        if response.status == 303 or (response.status in (301, 302) and method == "POST"):
+            # As browsers and urllib do, re-request with GET and without the body
+            method, body = "GET", None
+            headers = {k: v for k, v in headers.items() if k != "Content-Type"}
+        return _http_request(next_url, headers, method, body, redirects - 1)
+    if content and response.getheader("Content-Encoding") == "gzip":
+        content = gzip.decompress(content)
+    return response.status, response.reason, response.headers, content
+
+
+def _version_cache_path(url: str) -> Path:
+    return VERSION_CACHE_DIR / f"{hashlib.sha1(url.encode()).hexdigest()}.json"
+
+
+def _load_cached_response(path: Path) -> dict | None:
+    """Return a cached response, or None if missing or unreadable.
+
+    Entries are either {"etag", "last_modified", "body"} for a successful response or
+    {"status": 404, "checked_at"} for a package or repository that was not found.
+    """
+    try:
+        cached = load_json(path)
+    except (json.JSONDecodeError, OSError):
+        return None
+    if not isinstance(cached, dict):
+        return None
+    if cached.get("status") == 404 and isinstance(cached.get("checked_at"), (int, float)):
+        return cached
+    if (cached.get("etag") or cached.get("last_modified")) and isinstance(cached.get("body"), str):
+        return cached
+    return None
+
+
+def _save_cached_response(path: Path, entry: dict) -> None:
+    try:
+        VERSION_CACHE_DIR.mkdir(exist_ok=True)
+        write_json(path, entry)
+    except OSError as e:
+        print(f"Warning: Could not write version cache {path}: {e}", file=sys.stderr)
+
+
 def make_request(url: str, headers: dict | None = None) -> dict | str | None:
-    """Make HTTP request and return JSON response."""
-    req_headers = {"User-Agent": "ACP-Registry-Version-Checker/1.0"}
+    """Make HTTP request and return JSON response.
+
+    Connections are kept alive per thread and host, so repeated lookups against
+    the same registry skip the TCP and TLS handshakes. With ACP_VERSION_CACHE
+    set, responses are stored on disk and revalidated with If-None-Match or
+    If-Modified-Since (GitHub does not count 304s against the rate limit), and
+    404s are remembered for NEGATIVE_CACHE_TTL.
+    """
+    # PyPI's JSON includes the whole release history; gzip shrinks it several times over
+    req_headers = {"User-Agent": "ACP-Registry-Version-Checker/1.0", "Accept-Encoding": "gzip"}
     if headers:
         req_headers.update(headers)
 
@@ -74,21 +302,49 @@ def make_request(url: str, headers: dict | None = None) -> dict | str | None:
     if token and "api.github.com" in url:
         req_headers["Authorization"] = f"token {token}"
 
-    try:
-        req = urllib.request.Request(url, headers=req_headers)
-        with urllib.request.urlopen(req, timeout=30) as response:
-            content = response.read().decode("utf-8")
-            try:
-                return json.loads(content)
-            except json.JSONDecodeError:
-                return content
-    except urllib.error.HTTPError as e:
-        if e.code == 404:
+    cache_path = _version_cache_path(url) if USE_VERSION_CACHE else None
+    cached = _load_cached_response(cache_path) if cache_path else None
+    if cached and cached.get("status") == 404:
+        if time.time() - cached["checked_at"] < NEGATIVE_CACHE_TTL:
             return None
-        raise
-    except (urllib.error.URLError, TimeoutError, OSError):
+        cached = None
+    if cached:
+        if cached.get("etag"):
+            req_headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            req_headers["If-Modified-Since"] = cached["last_modified"]
+
+    bucket = _RATE_LIMITS.get(urllib.parse.urlsplit(url).hostname)
+    if bucket:
+        bucket.acquire()
+
+    try:
+        status, reason, resp_headers, body = _http_request(url, req_headers)
+    except (http.client.HTTPException, OSError):
         return None
 
+    if status == 304 and cached:
+        content = cached["body"]
+    elif status == 404:
+        if cache_path:
+            _save_cached_response(cache_path, {"status": 404, "checked_at": time.time()})
+        return None
+    elif status >= 400:
+        raise urllib.error.HTTPError(url, status, reason, None, None)
+    else:
+        content = body.decode("utf-8")
+        etag = resp_headers.get("ETag")
+        last_modified = resp_headers.get("Last-Modified")
+        if cache_path and (etag or last_modified):
+            _save_cached_response(
+                cache_path, {"etag": etag, "last_modified": last_modified, "body": content}
+            )
+
+    try:
+        return parse_json(content)
+    except json.JSONDecodeError:
+        return content
+
 
 def get_npm_latest_version(package_name: str) -> str | None:
     """Get latest version of an npm package."""
@@ -110,40 +366,114 @@ def get_pypi_latest_version(package_name: str) -> str | None:
     return None
 
 
+@functools.lru_cache(maxsize=512)
+def parse_github_repo(repo_url: str) -> tuple[str, str] | None:
+    """Extract (owner, repo) from a GitHub repository URL, without a .git suffix."""
+    match = _GITHUB_REPO_RE.search(repo_url)
+    if not match:
+        return None
+    owner, repo = match.groups()
+    return owner, repo.removesuffix(".git")
+
+
 def get_github_latest_release(repo_url: str) -> tuple[str | None, list[str]]:
     """Get latest release version and asset names from GitHub repo.
 
     Returns: (version, [asset_names])
     """
-    # Extract owner/repo from URL
-    match = re.search(r"github\.com/([^/]+)/([^/]+)", repo_url)
-    if not match:
+    parsed = parse_github_repo(repo_url)
+    if parsed is None:
         return None, []
 
-    owner, repo = match.groups()
-    if repo.endswith(".git"):
-        repo = repo[:-4]
+    owner, repo = parsed
+    prefetched = _github_releases.get((owner.lower(), repo.lower()))
+    if prefetched is not None:
+        return prefetched
 
     api_url = f"https://api.github.com/repos/{owner}/{repo}/releases/latest"
     data = make_request(api_url)
 
     if isinstance(data, dict):
-        tag = data.get("tag_name", "")
-        # Strip 'v' prefix if present
-        version = tag.lstrip("v") if tag else None
-        # Normalize to semver (x.y -> x.y.0)
-        if version and re.match(r"^\d+\.\d+$", version):
-            version = f"{version}.0"
         assets = [a["name"] for a in data.get("assets", [])]
-        return version, assets
+        return _release_version(data.get("tag_name", "")), assets
 
     return None, []
 
 
+def _release_version(tag: str) -> str | None:
+    """Turn a release tag into a semver version ("v1.2" -> "1.2.0")."""
+    # Strip 'v' prefix if present
+    version = tag.lstrip("v") if tag else None
+    # Normalize to semver (x.y -> x.y.0)
+    if version and _SHORT_VERSION_RE.match(version):
+        version = f"{version}.0"
+    return version
+
+
+def prefetch_github_releases(repo_urls: list[str]) -> None:
+    """Look up the latest releases of many repositories with batched GraphQL queries.
+
+    Results are used by get_github_latest_release(); repositories the query
+    could not resolve (or every repository, on error) fall back to the REST API.
+    GraphQL requires authentication, so this does nothing without GITHUB_TOKEN.
+    """
+    token = get_github_token()
+    if not token:
+        return
+
+    repos: dict[tuple[str, str], None] = {}
+    for repo_url in repo_urls:
+        parsed = parse_github_repo(repo_url)
+        if parsed is not None:
+            owner, repo = parsed
+            repos[(owner.lower(), repo.lower())] = None
+    batch = list(repos)
+
+    headers = {
+        "User-Agent": "ACP-Registry-Version-Checker/1.0",
+        "Authorization": f"bearer {token}",
+        "Content-Type": "application/json",
+        "Accept-Encoding": "gzip",
+    }
+    for start in range(0, len(batch), GITHUB_GRAPHQL_BATCH_SIZE):
+        chunk = batch[start : start + GITHUB_GRAPHQL_BATCH_SIZE]
+        fields = " ".join(
+            f"r{i}: repository(owner: {json.dumps(owner)}, name: {json.dumps(repo)}) "
+            "{ latestRelease { tagName releaseAssets(first: 100) { nodes { name } } } }"
+            for i, (owner, repo) in enumerate(chunk)
+        )
+        payload = json.dumps({"query": f"query {{ {fields} }}"}).encode()
+        _RATE_LIMITS["api.github.com"].acquire()
+        try:
+            status, reason, _headers, body = _http_request(
+                "https://api.github.com/graphql", headers, method="POST", body=payload
+            )
+            data = parse_json(body).get("data") if status == 200 else None
+        except (http.client.HTTPException, OSError, ValueError, AttributeError) as e:
+            print(f"Warning: GitHub GraphQL lookup failed: {e}", file=sys.stderr)
+            continue
+        if not isinstance(data, dict):
+            print(f"Warning: GitHub GraphQL lookup failed: {status} {reason}", file=sys.stderr)
+            continue
+
+        for i, key in enumerate(chunk):
+            repository = data.get(f"r{i}")
+            if not isinstance(repository, dict):
+                continue  # Not found (e.g. renamed); the REST API follows redirects
+            release = repository.get("latestRelease")
+            if release is None:
+                _github_releases[key] = (None, [])
+                continue
+            assets = [a["name"] for a in release.get("releaseAssets", {}).get("nodes", [])]
+            _github_releases[key] = (_release_version(release.get("tagName", "")), assets)
+
+
 def find_all_agents(registry_dir: Path) -> list[tuple[Path, dict]]:
     """Find all agent.json files in the registry, excluding quarantined ones."""
     agents = []
     quarantine = load_quarantine(registry_dir)
+    index = _load_agents_index() if USE_VERSION_CACHE else {}
+    new_index = {}
 
     for scan_dir in AGENT_DIRS:
         base_path = registry_dir / scan_dir if scan_dir != "." else registry_dir
@@ -151,43 +481,82 @@ def find_all_agents(registry_dir: Path) -> list[tuple[Path, dict]]:
         if not base_path.exists():
             continue
 
-        for entry_dir in sorted(base_path.iterdir()):
-            if not entry_dir.is_dir():
-                continue
-            if entry_dir.name in SKIP_DIRS:
+        # DirEntry caches the file type from readdir, so filtering needs no extra stat calls
+        with os.scandir(base_path) as it:
+            entry_names = sorted(
+                e.name
+                for e in it
+                if e.is_dir() and e.name not in SKIP_DIRS and not e.name.startswith(".")
+            )
+
+        for name in entry_names:
+            agent_json = base_path / name / "agent.json"
+            key = str(agent_json)
+            try:
+                st = agent_json.stat()
+                cached = index.get(key)
+                # Entries come from disk and may be stale or hand-edited; only trust
+                # well-formed ones, anything else is simply re-read
+                if (
+                    isinstance(cached, dict)
+                    and isinstance(cached.get("mtime"), int)
+                    and isinstance(cached.get("size"), int)
+                    and isinstance(cached.get("data"), dict)
+                    and cached["mtime"] == st.st_mtime_ns
+                    and cached["size"] == st.st_size
+                ):
+                    agent_data = cached["data"]
+                else:
+                    agent_data = load_json(agent_json)
+            except FileNotFoundError:
                 continue
-            if entry_dir.name.startswith("."):
+            except (json.JSONDecodeError, OSError) as e:
+                print(f"Warning: Could not read {agent_json}: {e}", file=sys.stderr)
                 continue
+            new_index[key] = {"mtime": st.st_mtime_ns, "size": st.st_size, "data": agent_data}
 
-            agent_json = entry_dir / "agent.json"
-            if agent_json.exists():
-                try:
-                    with open(agent_json) as f:
-                        agent_data = json.load(f)
-                except (json.JSONDecodeError, OSError) as e:
-                    print(f"Warning: Could not read {agent_json}: {e}", file=sys.stderr)
-                    continue
-
-                agent_id = agent_data.get("id", entry_dir.name)
-                if agent_id in quarantine:
-                    print(f"  ⊘ Quarantined {agent_id}: {quarantine[agent_id]}", file=sys.stderr)
-                    continue
+            agent_id = agent_data.get("id", name)
+            if agent_id in quarantine:
+                print(f"  ⊘ Quarantined {agent_id}: {quarantine[agent_id]}", file=sys.stderr)
+                continue
 
-                agents.append((agent_json, agent_data))
+            agents.append((agent_json, agent_data))
 
     if quarantine:
         print(f"  ({len(quarantine)} agent(s) quarantined)", file=sys.stderr)
         print(file=sys.stderr)
 
+    if USE_VERSION_CACHE and new_index != index:
+        _save_cached_response(AGENTS_INDEX_FILE, new_index)
+
     return agents
 
 
+def _load_agents_index() -> dict:
+    try:
+        index = load_json(AGENTS_INDEX_FILE)
+    except (OSError, ValueError):
+        return {}
+    return index if isinstance(index, dict) else {}
+
+
+def _load_last_checked() -> dict:
+    try:
+        last_checked = load_json(LAST_CHECKED_FILE)
+    except (OSError, ValueError):
+        return {}
+    return last_checked if isinstance(last_checked, dict) else {}
+
+
 def check_agent_version(
-    agent_path: Path, agent_data: dict
+    agent_path: Path, agent_data: dict, quick: bool = False
 ) -> tuple[VersionUpdate | None, UpdateError | None]:
     """Check if an agent has a newer version available.
 
     Checks ALL distribution sources and fails if they report different versions.
+    Sources are queried cheapest first (npm, PyPI, then rate-limited GitHub); with
+    quick=True the agent is reported up to date as soon as one source reports the
+    current version, skipping the cross-source check.
     """
     agent_id = agent_data.get("id", "unknown")
     current_version = agent_data.get("version", "0.0.0")
@@ -206,6 +575,8 @@ def check_agent_version(
         if not latest:
             return None, UpdateError(agent_id, f"Could not fetch npm version for {package_name}")
         source_versions["npx"] = (latest, f"https://registry.npmjs.org/{package_name}")
+        if quick and latest == current_version:
+            return None, None
 
     if "uvx" in distribution:
         package_spec = distribution["uvx"].get("package", "")
@@ -216,6 +587,8 @@ def check_agent_version(
         if not latest:
             return None, UpdateError(agent_id, f"Could not fetch PyPI version for {package_name}")
         source_versions["uvx"] = (latest, f"https://pypi.org/pypi/{package_name}/json")
+        if quick and latest == current_version:
+            return None, None
 
     if "binary" in distribution and repository:
         latest, _assets = get_github_latest_release(repository)
@@ -251,17 +624,41 @@ def check_agent_version(
         latest_version=latest_version,
         distribution_type=dist_types,
         source_url=primary_source_url,
+        agent_data=agent_data,
     ), None
 
 
+# (before, after) delimiters around a version in release URLs, replaced in this order;
+# short (x.y) versions only in the first three positions
+_URL_VERSION_DELIMITERS = (("/v", "/"), ("/", "/"), ("-", "."), ("-", "-"), ("_", "."), ("_", "_"))
+_URL_SHORT_VERSION_DELIMITERS = (("/", "/"), ("-", "."), ("-", "-"))
+
+
+def _replace_url_version(url: str, old: str, new: str, delimiters: tuple) -> str:
+    """Replace old with new wherever it sits between one of the delimiter pairs.
+
+    Each pair is a separate non-overlapping str.replace pass, so where two
+    occurrences share a delimiter the result depends on the pass order.
+    """
+    if old not in url:
+        return url
+    for before, after in delimiters:
+        url = url.replace(f"{before}{old}{after}", f"{before}{new}{after}")
+    return url
+
+
 def apply_update(update: VersionUpdate) -> bool:
-    """Apply a version update to an agent, updating all distribution types."""
-    try:
-        with open(update.agent_path) as f:
-            agent_data = json.load(f)
-    except (json.JSONDecodeError, OSError) as e:
-        print(f"Error reading {update.agent_path}: {e}", file=sys.stderr)
-        return False
+    """Apply a version update to an agent, updating all distribution types.
+
+    Updates update.agent_data in place when it is set; otherwise agent.json is read first.
+    """
+    agent_data = update.agent_data
+    if agent_data is None:
+        try:
+            agent_data = load_json(update.agent_path)
+        except (json.JSONDecodeError, OSError) as e:
+            print(f"Error reading {update.agent_path}: {e}", file=sys.stderr)
+            return False
 
     old_version = agent_data["version"]
     new_version = update.latest_version
@@ -279,41 +676,35 @@ def apply_update(update: VersionUpdate) -> bool:
     # Update uvx package spec if present
     if "uvx" in distribution:
         package_spec = distribution["uvx"].get("package", "")
-        new_package_spec = re.sub(r"([=@]+)[\d.]+", rf"\g<1>{new_version}", package_spec)
+        new_package_spec = _UVX_VERSION_RE.sub(lambda m: f"{m.group(1)}{new_version}", package_spec)
         distribution["uvx"]["package"] = new_package_spec
 
     # Update binary archive URLs if present
     if "binary" in distribution:
         # For URLs, also handle x.y.0 <-> x.y conversions
-        old_short = re.sub(r"\.0$", "", old_version)  # 1.6.0 -> 1.6
-        new_short = re.sub(r"\.0$", "", new_version)  # 1.7.0 -> 1.7
+        old_short = _TRAILING_ZERO_RE.sub("", old_version)  # 1.6.0 -> 1.6
+        new_short = _TRAILING_ZERO_RE.sub("", new_version)  # 1.7.0 -> 1.7
 
         for _platform, target in distribution["binary"].items():
             if "archive" in target:
                 original_url = target["archive"]
-                url = original_url
                 # Replace version in URL path (handles both vX.Y.Z and X.Y.Z patterns)
-                url = url.replace(f"/v{old_version}/", f"/v{new_version}/")
-                url = url.replace(f"/{old_version}/", f"/{new_version}/")
-                url = url.replace(f"-{old_version}.", f"-{new_version}.")
-                url = url.replace(f"-{old_version}-", f"-{new_version}-")
-                url = url.replace(f"_{old_version}.", f"_{new_version}.")
-                url = url.replace(f"_{old_version}_", f"_{new_version}_")
+                url = _replace_url_version(
+                    original_url, old_version, new_version, _URL_VERSION_DELIMITERS
+                )
                 # Also handle short versions (x.y) in URLs when semver is x.y.0
                 # Only apply if the full version wasn't found in the URL, to avoid
                 # old_short (e.g. "2.2") matching inside already-replaced new_version
                 # (e.g. "-2.2." in "-2.2.1.zip" -> "-2.2.1.1.zip")
                 if old_short != old_version and url == original_url:
-                    url = url.replace(f"/{old_short}/", f"/{new_short}/")
-                    url = url.replace(f"-{old_short}.", f"-{new_short}.")
-                    url = url.replace(f"-{old_short}-", f"-{new_short}-")
+                    url = _replace_url_version(
+                        url, old_short, new_short, _URL_SHORT_VERSION_DELIMITERS
+                    )
                 target["archive"] = url
 
     # Write back
     try:
-        with open(update.agent_path, "w") as f:
-            json.dump(agent_data, f, indent=2)
-            f.write("\n")
+        write_json(update.agent_path, agent_data)
         return True
     except OSError as e:
         print(f"Error writing {update.agent_path}: {e}", file=sys.stderr)
@@ -339,6 +730,12 @@ def main():
         action="store_true",
         help="Output results as JSON",
     )
+    parser.add_argument(
+        "--quick",
+        action="store_true",
+        help="Stop at the first source reporting the current version "
+        "(skips the cross-source mismatch check)",
+    )
     args = parser.parse_args()
 
     # Determine registry directory
@@ -349,37 +746,84 @@ def main():
 
     # Filter by agent IDs if specified
     if args.agents:
-        filter_ids = set(args.agents.split(","))
-        agents = [(p, d) for p, d in agents if d.get("id") in filter_ids]
+        filter_ids = frozenset(args.agents.split(","))
+        # Index once so each requested ID is a dict lookup; the first entry wins for
+        # duplicate IDs, which build_registry rejects anyway
+        by_id: dict[str, tuple[Path, dict]] = {}
+        for p, d in agents:
+            by_id.setdefault(d.get("id"), (p, d))
+        agents = [by_id[agent_id] for agent_id in filter_ids if agent_id in by_id]
 
     # Sort deterministically by agent ID
     agents.sort(key=lambda x: x[1].get("id", ""))
 
+    # Skip agents that were up to date at this same version within LAST_CHECKED_TTL;
+    # an applied update changes the version, so bumped agents are always re-checked
+    last_checked = _load_last_checked() if LAST_CHECKED_TTL > 0 else {}
+    now = time.time()
+    recently_checked = set()
+    for _p, d in agents:
+        entry = last_checked.get(d.get("id"))
+        if (
+            isinstance(entry, dict)
+            and entry.get("version") == d.get("version")
+            and isinstance(entry.get("checked_at"), (int, float))
+            and now - entry["checked_at"] < LAST_CHECKED_TTL
+        ):
+            recently_checked.add(d.get("id"))
+
+    # Fetch the latest GitHub releases of all binary agents in as few requests as possible
+    prefetch_github_releases(
+        [
+            d["repository"]
+            for _p, d in agents
+            if "binary" in d.get("distribution", {})
+            and d.get("repository")
+            and d.get("id") not in recently_checked
+        ]
+    )
+
     updates: list[VersionUpdate] = []
     errors: list[UpdateError] = []
     up_to_date: list[str] = []
 
-    # Check each agent
-    for agent_path, agent_data in agents:
-        agent_id = agent_data.get("id", "unknown")
+    # Check agents concurrently; each check is dominated by registry round trips.
+    # Results come back in agent order, so the report stays deterministic.
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        results = executor.map(
+            lambda agent: (
+                (None, None)
+                if agent[1].get("id") in recently_checked
+                else check_agent_version(*agent, quick=args.quick)
+            ),
+            agents,
+        )
+        for (_agent_path, agent_data), (update, error) in zip(agents, results, strict=True):
+            agent_id = agent_data.get("id", "unknown")
 
-        if not args.json:
-            print(f"Checking {agent_id}...", end=" ", flush=True)
+            if not args.json:
+                print(f"Checking {agent_id}...", end=" ", flush=True)
 
-        update, error = check_agent_version(agent_path, agent_data)
+            if error:
+                errors.append(error)
+                if not args.json:
+                    print(f"ERROR: {error.error}")
+            elif update:
+                updates.append(update)
+                if not args.json:
+                    print(f"UPDATE: {update.current_version} -> {update.latest_version}")
+            else:
+                up_to_date.append(agent_id)
+                if LAST_CHECKED_TTL > 0 and agent_id not in recently_checked:
+                    last_checked[agent_id] = {
+                        "version": agent_data.get("version"),
+                        "checked_at": now,
+                    }
+                if not args.json:
+                    print(f"OK ({agent_data.get('version', 'unknown')})")
 
-        if error:
-            errors.append(error)
-            if not args.json:
-                print(f"ERROR: {error.error}")
-        elif update:
-            updates.append(update)
-            if not args.json:
-                print(f"UPDATE: {update.current_version} -> {update.latest_version}")
-        else:
-            up_to_date.append(agent_id)
-            if not args.json:
-                print(f"OK ({agent_data.get('version', 'unknown')})")
+    if LAST_CHECKED_TTL > 0:
+        _save_cached_response(LAST_CHECKED_FILE, last_checked)
 
     # Output results
     if args.json:
@@ -398,7 +842,9 @@ def main():
             "errors": [{"agent_id": e.agent_id, "error": e.error} for e in errors],
             "up_to_date": up_to_date,
         }
-        print(json.dumps(result, indent=2))
+        sys.stdout.flush()
+        sys.stdout.buffer.write(dump_json(result))
+        sys.stdout.buffer.flush()
     else:
         print()
         print("=" * 60)
@@ -427,10 +873,13 @@ def main():
         print("Applying updates...")
         applied = 0
         failed = 0
-        for update in updates:
+        # Each update rewrites its own agent.json, so they can be applied concurrently
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            results = list(executor.map(apply_update, updates))
+        for update, ok in zip(updates, results, strict=True):
             if not args.json:
-                print(f"  Updating {update.agent_id}...", end=" ", flush=True)
-            if apply_update(update):
+                print(f"  Updating {update.agent_id}...", end=" ")
+            if ok:
                 applied += 1
                 if not args.json:
                     print("OK")
@@ -6,19 +6,29 @@ Supports optional ACP auth verification via --auth-check flag.
 """
 
 import argparse
+import collections
+import contextlib
+import functools
+import hashlib
+import http.client
+import io
 import json
 import os
 import platform
+import re
 import shutil
 import subprocess
 import sys
 import tarfile
+import threading
+import time
 import urllib.request
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import NamedTuple
 
-from registry_utils import SKIP_DIRS, load_quarantine
+from registry_utils import SKIP_DIRS, load_json, load_quarantine
 
 # Import auth client (only needed when --auth-check is used)
 try:
@@ -42,6 +52,59 @@ DEFAULT_TIMEOUT = 10  # seconds
 STARTUP_GRACE = 2  # seconds to wait before checking if process is alive
 DEFAULT_SANDBOX_DIR = ".sandbox"
 DEFAULT_AUTH_TIMEOUT = 120  # seconds for ACP handshake (includes npx download time)
+# Sent to launched agents so a responsive one can be stopped without waiting for the timeout
+ACP_INITIALIZE = (
+    json.dumps(
+        {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "method": "initialize",
+            "params": {"protocolVersion": 1, "clientCapabilities": {}},
+        }
+    )
+    + "\n"
+)
+ACP_ANSWERED = "(answered ACP initialize - terminated)"
+# Seconds to wait for that answer before closing stdin, so agents that stop at the
+# end of their input exit promptly as they did with an empty stdin
+ACP_REPLY_WINDOW = 2
+UV_CACHE_DIR = "uv-cache"  # uvx --cache-dir inside the agent's sandbox, kept by --clean
+OUTPUT_TAIL_LINES = 256  # lines of stdout/stderr kept per launched process
+ARCHIVE_CACHE_DIR = "_cache"  # under the sandbox base; archives shared by URL across agents
+EXTRACTED_SENTINEL_PREFIX = ".extracted-"  # marks which archive an extracted/ dir came from
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024  # bytes per read when streaming archives to disk
+RANGE_CHUNK_SIZE = 4 * 1024 * 1024  # bytes per parallel range request for large downloads
+RANGE_WORKERS = 8  # concurrent range requests per download
+EXTRACT_BUFFER_SIZE = 2 * 1024 * 1024  # tarfile's per-member copy buffer (default 16 KiB)
+DEFAULT_JOBS = min(16, (os.cpu_count() or 1) * 2)  # agents verified concurrently
+
+
+# Output showing a launched program is waiting for input, i.e. it works
+_NEEDS_INPUT_RE = re.compile("input|prompt|stdin", re.IGNORECASE)
+# Output showing a binary runs but its environment is not set up (keyring, config, ...)
+_ENV_ISSUE_RE = re.compile(
+    "|".join(
+        re.escape(issue)
+        for issue in (
+            "keyring",
+            "keychain",
+            "credential",
+            "permission denied",
+            "access denied",
+            "configuration file not found",
+            "config file not found",
+            "providers.json",
+            "cannot find package",
+            "module_not_found",
+            "cannot find module",
+            "accepts 1 arg",
+            "required argument",
+            "missing argument",
+            "agent-file",
+        )
+    ),
+    re.IGNORECASE,
+)
 
 
 class Result(NamedTuple):
@@ -52,6 +115,37 @@ class Result(NamedTuple):
     skipped: bool = False
 
 
+class _ThreadLocalOutput:
+    """Wraps stdout so worker threads can buffer their own output.
+
+    Agents are verified concurrently; each worker captures what it prints and
+    the main thread writes it out in one piece, so agent logs do not interleave.
+    """
+
+    def __init__(self, stream):
+        self._stream = stream
+        self._local = threading.local()
+
+    def write(self, text: str) -> int:
+        return (getattr(self._local, "buffer", None) or self._stream).write(text)
+
+    def flush(self) -> None:
+        if getattr(self._local, "buffer", None) is None:
+            self._stream.flush()
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+    @contextlib.contextmanager
+    def capture(self):
+        self._local.buffer = io.StringIO()
+        try:
+            yield self._local.buffer
+        finally:
+            self._local.buffer = None
+
+
+@functools.lru_cache(maxsize=1)
 def get_current_platform() -> str:
     """Get current platform identifier."""
     system = platform.system()
@@ -61,30 +155,205 @@ def get_current_platform() -> str:
 
 def check_command_exists(cmd: str) -> bool:
     """Check if a command exists in PATH."""
-    return shutil.which(cmd) is not None
+    return _which(cmd) is not None
+
+
+@functools.lru_cache(maxsize=64)
+def _which(cmd: str) -> str | None:
+    """shutil.which, memoized: PATH does not change while agents are verified."""
+    return shutil.which(cmd)
+
+
+def _download_request(url: str) -> urllib.request.Request:
+    """GET request for url, identifying the verifier."""
+    req = urllib.request.Request(url)
+    req.add_header("User-Agent", "ACP-Registry-Verifier/1.0")
+    return req
+
+
+def _download_ranges(url: str, part: Path, total: int) -> None:
+    """Fetch url into part as RANGE_CHUNK_SIZE byte ranges on parallel connections.
+
+    Every range is written at its offset with os.pwrite on one shared descriptor.
+    Raises OSError if a range is refused, short, or fails.
+    """
+    fd = os.open(part, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+
+    def fetch(start: int) -> None:
+        end = min(start + RANGE_CHUNK_SIZE, total) - 1
+        req = _download_request(url)
+        req.add_header("Range", f"bytes={start}-{end}")
+        with urllib.request.urlopen(req, timeout=60) as response:
+            if response.status != 206:
+                raise OSError(f"range request answered with {response.status}")
+            buffer = memoryview(bytearray(DOWNLOAD_CHUNK_SIZE))
+            offset = start
+            while n := response.readinto(buffer):
+                chunk = buffer[:n]
+                while chunk:
+                    written = os.pwrite(fd, chunk, offset)
+                    offset += written
+                    chunk = chunk[written:]
+            if offset != end + 1:
+                raise OSError(f"incomplete range {start}-{end}")
+
+    try:
+        os.ftruncate(fd, total)
+        with ThreadPoolExecutor(max_workers=RANGE_WORKERS) as executor:
+            list(executor.map(fetch, range(0, total, RANGE_CHUNK_SIZE)))
+    finally:
+        os.close(fd)
+
+
+def _stream_to(response, part: Path, total: int | None) -> int:
+    """Copy a response body to part, returning its size."""
+    with open(part, "wb") as f:
+        shutil.copyfileobj(response, f, DOWNLOAD_CHUNK_SIZE)
+        size = f.tell()
+    if total and size != total:
+        raise OSError(f"incomplete download: got {size} of {total} bytes")
+    return size
 
 
 def download_file(url: str, dest: Path) -> bool:
-    """Download a file from URL with progress."""
+    """Download a file from URL with progress.
+
+    The body is streamed to a temporary file in DOWNLOAD_CHUNK_SIZE pieces, so
+    memory use does not grow with the archive, and only moved to dest once it is
+    complete; an interrupted download is never mistaken for a cached archive.
+    Large files from servers that accept byte ranges are fetched in parallel chunks,
+    falling back to a single streamed GET if any range fails.
+    """
+    part = dest.with_name(dest.name + ".part")
     try:
-        req = urllib.request.Request(url)
-        req.add_header("User-Agent", "ACP-Registry-Verifier/1.0")
-        with urllib.request.urlopen(req, timeout=60) as response:
+        with urllib.request.urlopen(_download_request(url), timeout=60) as response:
             total = response.headers.get("Content-Length")
             if total:
                 total = int(total)
                 print(f"      Downloading {total / 1024 / 1024:.1f} MB...", end="", flush=True)
             else:
                 print("      Downloading...", end="", flush=True)
-            data = response.read()
-            dest.write_bytes(data)
-            print(f" done ({len(data) / 1024 / 1024:.1f} MB)")
+            ranged = (
+                total
+                and total >= 2 * RANGE_CHUNK_SIZE
+                and response.headers.get("Accept-Ranges") == "bytes"
+                # os.pwrite is not available on Windows
+                and hasattr(os, "pwrite")
+            )
+            if not ranged:
+                size = _stream_to(response, part, total)
+        if ranged:
+            try:
+                # Ranges go to the final URL, after any redirect (e.g. GitHub release assets)
+                _download_ranges(response.url, part, total)
+                size = total
+            except (OSError, http.client.HTTPException) as e:
+                # Some servers advertise Accept-Ranges but ignore or mishandle Range
+                part.unlink(missing_ok=True)
+                print(f" ranges failed ({e}), retrying in one piece...", end="", flush=True)
+                with urllib.request.urlopen(_download_request(url), timeout=60) as response:
+                    size = _stream_to(response, part, total)
+        os.replace(part, dest)
+        print(f" done ({size / 1024 / 1024:.1f} MB)")
         return True
     except Exception as e:
+        part.unlink(missing_ok=True)
         print(f"\n      Download failed: {e}")
         return False
 
 
+# One lock per archive URL, so concurrent workers download a shared archive only once
+_archive_locks: dict[str, threading.Lock] = {}
+_archive_locks_lock = threading.Lock()
+
+
+def archive_key(url: str) -> str:
+    """Identify the (immutable) archive published at url."""
+    return hashlib.sha256(url.encode()).hexdigest()
+
+
+def fetch_archive(url: str, sandbox: Path) -> Path | None:
+    """Place the archive at url in the agent's sandbox, downloading it at most once.
+
+    Archives are kept in <sandbox base>/_cache/<sha256 of url>/ and hard-linked
+    (or copied, across filesystems) into the sandbox, so --clean runs and agents
+    sharing a release asset reuse the earlier download.
+    Returns the archive path in the sandbox, or None if the download failed.
+    """
+    archive_name = url.split("/")[-1]
+    archive_path = sandbox / archive_name
+    if archive_path.exists():
+        print(f"    → Using cached archive: {archive_name}")
+        return archive_path
+
+    key = archive_key(url)
+    cache_dir = sandbox.parent.parent / ARCHIVE_CACHE_DIR / key
+    cached = cache_dir / archive_name
+    with _archive_locks_lock:
+        lock = _archive_locks.setdefault(key, threading.Lock())
+    with lock:
+        if cached.exists():
+            print(f"    → Using cached archive: {archive_name}")
+        else:
+            print(f"    → Downloading from: {url[:80]}...")
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            if not download_file(url, cached):
+                return None
+
+    try:
+        os.link(cached, archive_path)
+    except OSError:
+        shutil.copyfile(cached, archive_path)
+    return archive_path
+
+
+def extract_once(archive: Path, dest: Path, key: str) -> bool:
+    """Extract archive into dest unless dest already holds this archive's contents.
+
+    A .extracted-<key> sentinel records which archive dest was extracted from;
+    a missing or different sentinel (e.g. after a version bump) re-extracts.
+    """
+    sentinel = dest / f"{EXTRACTED_SENTINEL_PREFIX}{key}"
+    if sentinel.exists():
+        print("    → Using cached extraction")
+        return True
+    if dest.exists():
+        shutil.rmtree(dest, ignore_errors=True)
+    _index_extract_dir.cache_clear()
+    print("    → Extracting archive...")
+    dest.mkdir()
+    if not extract_archive(archive, dest):
+        return False
+    sentinel.touch()
+    return True
+
+
+@functools.lru_cache(maxsize=256)
+def _index_extract_dir(extract_dir: str) -> dict[str, list[str]]:
+    """Map each file name under extract_dir to its paths, in walk order."""
+    index: dict[str, list[str]] = {}
+    for root, _dirs, files in os.walk(extract_dir):
+        for name in files:
+            index.setdefault(name, []).append(os.path.join(root, name))
+    return index
+
+
+def find_executable(extract_dir: Path, cmd: str) -> Path | None:
+    """Find cmd (a file name or relative path) anywhere under extract_dir.
+
+    Equivalent to the first match of extract_dir.rglob(cmd), but the directory
+    is walked once and the index reused by later lookups.
+    """
+    parts = Path(cmd).parts
+    if not parts:
+        return None
+    for candidate in _index_extract_dir(str(extract_dir)).get(parts[-1], ()):
+        path = Path(candidate)
+        if path.relative_to(extract_dir).parts[-len(parts) :] == parts:
+            return path
+    return None
+
+
 def extract_archive(archive: Path, dest: Path) -> bool:
     """Extract archive to destination."""
     try:
@@ -92,16 +361,18 @@ def extract_archive(archive: Path, dest: Path) -> bool:
             with zipfile.ZipFile(archive) as zf:
                 zf.extractall(dest)
         elif archive.name.endswith(".tar.gz") or archive.name.endswith(".tgz"):
-            with tarfile.open(archive, "r:gz") as tf:
+            with tarfile.open(archive, "r:gz", copybufsize=EXTRACT_BUFFER_SIZE) as tf:
                 tf.extractall(dest, filter="data")
         elif archive.name.endswith(".tar.bz2"):
-            with tarfile.open(archive, "r:bz2") as tf:
+            with tarfile.open(archive, "r:bz2", copybufsize=EXTRACT_BUFFER_SIZE) as tf:
                 tf.extractall(dest, filter="data")
         elif archive.name.endswith(".tar"):
-            with tarfile.open(archive, "r") as tf:
+            with tarfile.open(archive, "r", copybufsize=EXTRACT_BUFFER_SIZE) as tf:
                 tf.extractall(dest, filter="data")
         else:
-            # Single file (like .exe or raw binary)
+            # Single file (like .exe or raw binary). Copied, not linked: the archive
+            # shares its inode with the _cache entry, and the binary gets chmodded
+            # and may be rewritten by the agent it runs
             shutil.copy(archive, dest / archive.name)
         return True
     except Exception as e:
@@ -109,33 +380,97 @@ def extract_archive(archive: Path, dest: Path) -> bool:
         return False
 
 
+def _is_initialize_reply(line: str) -> bool:
+    """Check whether a stdout line is the agent's response to ACP_INITIALIZE."""
+    try:
+        message = json.loads(line)
+    except ValueError:
+        return False
+    return isinstance(message, dict) and message.get("id") == 1 and "result" in message
+
+
+def _probe_acp(proc: subprocess.Popen, timeout: int) -> tuple[int | None, str, str]:
+    """Send an ACP initialize request and stop the process as soon as it answers.
+
+    Without an answer within ACP_REPLY_WINDOW stdin is closed, and the process is
+    left to exit or run until the timeout.
+    """
+    answered = threading.Event()
+    # Only the tail is kept: enough to classify a failure, bounded however chatty the
+    # agent (or npx/uvx download progress) is
+    stdout_lines = collections.deque(maxlen=OUTPUT_TAIL_LINES)
+    stderr_lines = collections.deque(maxlen=OUTPUT_TAIL_LINES)
+
+    def read_stdout():
+        for line in proc.stdout:
+            stdout_lines.append(line)
+            if not answered.is_set() and _is_initialize_reply(line):
+                answered.set()
+
+    def read_stderr():
+        stderr_lines.extend(proc.stderr)
+
+    readers = [threading.Thread(target=fn, daemon=True) for fn in (read_stdout, read_stderr)]
+    for reader in readers:
+        reader.start()
+    try:
+        proc.stdin.write(ACP_INITIALIZE)
+        proc.stdin.flush()
+    except OSError:
+        pass  # Exited before reading stdin; the exit code tells the story
+
+    started = time.monotonic()
+    while not answered.wait(0.1):
+        elapsed = time.monotonic() - started
+        if proc.poll() is not None or elapsed >= timeout:
+            break
+        if elapsed >= ACP_REPLY_WINDOW and not proc.stdin.closed:
+            with contextlib.suppress(OSError):
+                proc.stdin.close()
+
+    if proc.poll() is None:
+        proc.terminate()
+        try:
+            proc.wait(timeout=2)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+        if answered.is_set():
+            return None, "".join(stdout_lines), ACP_ANSWERED
+        return None, "", "(process was still running - terminated)"
+
+    # Child processes may keep the pipes open, so don't wait on the readers forever
+    for reader in readers:
+        reader.join(timeout=2)
+    return proc.returncode, "".join(stdout_lines), "".join(stderr_lines)
+
+
 def run_process(cmd: list[str], cwd: Path, env: dict, timeout: int) -> tuple[int | None, str, str]:
-    """Run a process with timeout, return (exit_code, stdout, stderr)."""
-    full_env = os.environ.copy()
-    full_env.update(env)
+    """Run a process with timeout, return (exit_code, stdout, stderr).
+
+    An ACP initialize request is written to stdin and the process is stopped
+    as soon as it answers (exit_code None, stderr ACP_ANSWERED) instead of
+    being left to run until the timeout.
+    """
+    # Without agent-specific variables the child simply inherits our environment;
+    # either way it sees os.environ as it is now, not as it was at import
+    full_env = os.environ | env if env else None
 
     try:
         proc = subprocess.Popen(
             cmd,
             cwd=cwd,
             env=full_env,
-            stdin=subprocess.DEVNULL,  # Provide empty stdin
+            stdin=subprocess.PIPE,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
             text=True,
         )
 
         try:
-            stdout, stderr = proc.communicate(timeout=timeout)
-            return proc.returncode, stdout, stderr
-        except subprocess.TimeoutExpired:
-            # Process still running after timeout - this is often good (waiting for input)
-            proc.terminate()
-            try:
-                proc.wait(timeout=2)
-            except subprocess.TimeoutExpired:
-                proc.kill()
-            return None, "", "(process was still running - terminated)"
+            return _probe_acp(proc, timeout)
+        finally:
+            with contextlib.suppress(OSError):
+                proc.stdin.close()
 
     except FileNotFoundError as e:
         return -1, "", f"Command not found: {e}"
@@ -143,6 +478,13 @@ def run_process(cmd: list[str], cwd: Path, env: dict, timeout: int) -> tuple[int
         return -1, "", f"Execution error: {e}"
 
 
+def _running_message(stderr: str) -> str:
+    """Describe a launch that was still running when it was stopped."""
+    if stderr == ACP_ANSWERED:
+        return "Started successfully (answered ACP initialize)"
+    return "Started successfully (terminated after timeout)"
+
+
 def verify_binary(agent: dict, sandbox: Path, timeout: int, verbose: bool) -> Result:
     """Verify binary distribution."""
     agent_id = agent["id"]
@@ -159,25 +501,14 @@ def verify_binary(agent: dict, sandbox: Path, timeout: int, verbose: bool) -> Re
     env = target.get("env", {})
 
     # Download (skip if already exists)
-    archive_name = archive_url.split("/")[-1]
-    archive_path = sandbox / archive_name
     extract_dir = sandbox / "extracted"
-
-    if not archive_path.exists():
-        print(f"    → Downloading from: {archive_url[:80]}...")
-        if not download_file(archive_url, archive_path):
-            return Result(agent_id, "binary", False, "Download failed")
-    else:
-        print(f"    → Using cached archive: {archive_name}")
+    archive_path = fetch_archive(archive_url, sandbox)
+    if archive_path is None:
+        return Result(agent_id, "binary", False, "Download failed")
 
     # Extract (skip if already extracted)
-    if not extract_dir.exists():
-        print("    → Extracting archive...")
-        extract_dir.mkdir()
-        if not extract_archive(archive_path, extract_dir):
-            return Result(agent_id, "binary", False, "Extraction failed")
-    else:
-        print("    → Using cached extraction")
+    if not extract_once(archive_path, extract_dir, archive_key(archive_url)):
+        return Result(agent_id, "binary", False, "Extraction failed")
 
     # Find executable
     if cmd.startswith("./"):
@@ -185,7 +516,7 @@ def verify_binary(agent: dict, sandbox: Path, timeout: int, verbose: bool) -> Re
 
     # Check if cmd is a system command (node, python, etc.)
     if cmd in ("node", "python", "python3", "java", "ruby"):
-        system_cmd = shutil.which(cmd)
+        system_cmd = _which(cmd)
         if not system_cmd:
             return Result(
                 agent_id,
@@ -202,20 +533,21 @@ def verify_binary(agent: dict, sandbox: Path, timeout: int, verbose: bool) -> Re
         exe_path = None
 
         # First try exact match
-        for path in extract_dir.rglob(cmd):
-            exe_path = path
-            break
+        exe_path = find_executable(extract_dir, cmd)
 
         # If not found, try raw binary (file downloaded without archive)
         if not exe_path:
             # Check if there's only one file in extract_dir (raw binary case)
-            files_in_extract = list(extract_dir.iterdir())
+            files_in_extract = [
+                p for p in extract_dir.iterdir() if not p.name.startswith(EXTRACTED_SENTINEL_PREFIX)
+            ]
             if len(files_in_extract) == 1 and files_in_extract[0].is_file():
                 # Rename the raw binary to expected name
                 raw_file = files_in_extract[0]
                 expected_path = extract_dir / cmd
                 if not expected_path.exists():
                     raw_file.rename(expected_path)
+                    _index_extract_dir.cache_clear()
                 exe_path = expected_path
 
         if not exe_path:
@@ -225,9 +557,11 @@ def verify_binary(agent: dict, sandbox: Path, timeout: int, verbose: bool) -> Re
         if not exe_path.exists():
             return Result(agent_id, "binary", False, f"Executable not found: {cmd}")
 
-    # Make executable on Unix
+    # Make executable on Unix, skipping the chmod when the mode already allows it
     if platform.system() != "Windows":
-        exe_path.chmod(exe_path.stat().st_mode | 0o755)
+        mode = exe_path.stat().st_mode
+        if not mode & 0o111:
+            exe_path.chmod(mode | 0o755)
 
     # Run
     print(f"    → Running: {exe_path.name} {' '.join(args)}")
@@ -238,34 +572,16 @@ def verify_binary(agent: dict, sandbox: Path, timeout: int, verbose: bool) -> Re
     # Check result
     if exit_code is None:
         # Process was still running - good sign
-        return Result(agent_id, "binary", True, "Started successfully (terminated after timeout)")
+        return Result(agent_id, "binary", True, _running_message(stderr))
     elif exit_code == 0:
         return Result(agent_id, "binary", True, "Exited cleanly")
     else:
-        combined = (stdout + stderr).lower()
         # Check if it's a "needs input" error (still means binary works)
-        if "input" in combined or "prompt" in combined or "stdin" in combined:
+        if _NEEDS_INPUT_RE.search(stdout) or _NEEDS_INPUT_RE.search(stderr):
             return Result(agent_id, "binary", True, "Binary works (needs input)")
         # Check for environment issues (keyring, permissions, etc.)
         # Binary works but env fails
-        env_issues = [
-            "keyring",
-            "keychain",
-            "credential",
-            "permission denied",
-            "access denied",
-            "configuration file not found",
-            "config file not found",
-            "providers.json",
-            "cannot find package",
-            "module_not_found",
-            "cannot find module",
-            "accepts 1 arg",
-            "required argument",
-            "missing argument",
-            "agent-file",
-        ]
-        if any(issue in combined for issue in env_issues):
+        if _ENV_ISSUE_RE.search(stdout) or _ENV_ISSUE_RE.search(stderr):
             return Result(agent_id, "binary", True, "Binary works (env setup needed)")
         msg = stderr[:200] if stderr else f"Exit code: {exit_code}"
         return Result(agent_id, "binary", False, msg)
@@ -289,13 +605,12 @@ def verify_npx(agent: dict, sandbox: Path, timeout: int, verbose: bool) -> Resul
     exit_code, stdout, stderr = run_process(cmd, sandbox, env, timeout)
 
     if exit_code is None:
-        return Result(agent_id, "npx", True, "Started successfully (terminated after timeout)")
+        return Result(agent_id, "npx", True, _running_message(stderr))
     elif exit_code == 0:
         return Result(agent_id, "npx", True, "Exited cleanly")
     else:
         # Check if it's a "needs input" error (still means package works)
-        combined = (stdout + stderr).lower()
-        if "input" in combined or "prompt" in combined or "stdin" in combined:
+        if _NEEDS_INPUT_RE.search(stdout) or _NEEDS_INPUT_RE.search(stderr):
             return Result(agent_id, "npx", True, "Package works (needs input)")
         msg = stderr[:200] if stderr else f"Exit code: {exit_code}"
         return Result(agent_id, "npx", False, msg)
@@ -315,20 +630,19 @@ def verify_uvx(agent: dict, sandbox: Path, timeout: int, verbose: bool) -> Resul
 
     print(f"    → Running: uvx {package} {' '.join(args)}")
 
-    cache_dir = sandbox / "uv-cache"
+    cache_dir = sandbox / UV_CACHE_DIR
     cache_dir.mkdir(exist_ok=True)
 
     cmd = ["uvx", "--cache-dir", str(cache_dir), package] + args
     exit_code, stdout, stderr = run_process(cmd, sandbox, env, timeout)
 
     if exit_code is None:
-        return Result(agent_id, "uvx", True, "Started successfully (terminated after timeout)")
+        return Result(agent_id, "uvx", True, _running_message(stderr))
     elif exit_code == 0:
         return Result(agent_id, "uvx", True, "Exited cleanly")
     else:
         # Check if it's a "needs input" error (still means package works)
-        combined = (stdout + stderr).lower()
-        if "input" in combined or "prompt" in combined or "stdin" in combined:
+        if _NEEDS_INPUT_RE.search(stdout) or _NEEDS_INPUT_RE.search(stderr):
             return Result(agent_id, "uvx", True, "Package works (needs input)")
         # Filter out download progress noise from stderr
         error_lines = [
@@ -356,21 +670,14 @@ def prepare_binary(agent: dict, sandbox: Path) -> tuple[bool, str]:
     archive_url = target["archive"]
 
     # Download (skip if already exists)
-    archive_name = archive_url.split("/")[-1]
-    archive_path = sandbox / archive_name
     extract_dir = sandbox / "extracted"
-
-    if not archive_path.exists():
-        print(f"    → Downloading from: {archive_url[:80]}...")
-        if not download_file(archive_url, archive_path):
-            return False, "Download failed"
+    archive_path = fetch_archive(archive_url, sandbox)
+    if archive_path is None:
+        return False, "Download failed"
 
     # Extract (skip if already extracted)
-    if not extract_dir.exists():
-        print("    → Extracting archive...")
-        extract_dir.mkdir()
-        if not extract_archive(archive_path, extract_dir):
-            return False, "Extraction failed"
+    if not extract_once(archive_path, extract_dir, archive_key(archive_url)):
+        return False, "Extraction failed"
 
     return True, "Binary prepared"
 
@@ -398,7 +705,7 @@ def build_agent_command(
         package = uvx_dist.get("package", "")
         args = uvx_dist.get("args", [])
         env = uvx_dist.get("env", {})
-        cache_dir = sandbox / "uv-cache"
+        cache_dir = sandbox / UV_CACHE_DIR
         cache_dir.mkdir(exist_ok=True)
         cmd = ["uvx", "--cache-dir", str(cache_dir), package] + args
         cwd = sandbox
@@ -416,14 +723,9 @@ def build_agent_command(
             target_cmd = target_cmd[2:]
 
         if target_cmd in ("node", "python", "python3", "java", "ruby"):
-            exe_path = Path(shutil.which(target_cmd) or target_cmd)
+            exe_path = Path(_which(target_cmd) or target_cmd)
         else:
-            exe_path = None
-            for path in extract_dir.rglob(target_cmd):
-                exe_path = path
-                break
-            if not exe_path:
-                exe_path = extract_dir / target_cmd
+            exe_path = find_executable(extract_dir, target_cmd) or extract_dir / target_cmd
 
         cmd = [str(exe_path)] + args
         cwd = extract_dir
@@ -563,6 +865,16 @@ def verify_agent(
                 if extracted.exists():
                     print("    Cleaning extracted files (keeping downloads)...")
                     shutil.rmtree(extracted, ignore_errors=True)
+            elif dtype == "uvx":
+                # Keep uv's download cache, like binary archives above
+                print("    Cleaning sandbox (keeping uv cache)...")
+                for path in sandbox.iterdir():
+                    if path.name == UV_CACHE_DIR:
+                        continue
+                    if path.is_dir() and not path.is_symlink():
+                        shutil.rmtree(path, ignore_errors=True)
+                    else:
+                        path.unlink(missing_ok=True)
             else:
                 print("    Cleaning sandbox...")
                 shutil.rmtree(sandbox, ignore_errors=True)
@@ -608,22 +920,21 @@ def load_registry(registry_dir: Path) -> list[dict]:
     agents = []
     quarantine = load_quarantine(registry_dir)
 
-    for agent_dir in sorted(registry_dir.iterdir()):
-        if not agent_dir.is_dir() or agent_dir.name in SKIP_DIRS:
-            continue
-
-        agent_json = agent_dir / "agent.json"
-        if not agent_json.exists():
-            continue
+    # DirEntry caches the file type from readdir, so filtering needs no extra stat calls
+    with os.scandir(registry_dir) as it:
+        entry_names = sorted(e.name for e in it if e.is_dir() and e.name not in SKIP_DIRS)
 
+    for name in entry_names:
+        agent_json = registry_dir / name / "agent.json"
         try:
-            with open(agent_json) as f:
-                agent = json.load(f)
+            agent = load_json(agent_json)
+        except FileNotFoundError:
+            continue
         except json.JSONDecodeError as e:
             print(f"Warning: Invalid JSON in {agent_json}: {e}")
             continue
 
-        agent_id = agent.get("id", agent_dir.name)
+        agent_id = agent.get("id", name)
         if agent_id in quarantine:
             print(f"  ⊘ Quarantined {agent_id}: {quarantine[agent_id]}")
             continue
@@ -649,6 +960,7 @@ Examples:
   %(prog)s --clean                  # Clean sandboxes before running
   %(prog)s --clean-all              # Remove all sandboxes and exit
   %(prog)s --auth-check             # Verify ACP auth support (deeper test)
+  %(prog)s -j 1                     # Verify agents one at a time
 """,
     )
     parser.add_argument("--agent", "-a", help="Verify specific agent IDs (comma-separated)")
@@ -686,6 +998,13 @@ Examples:
         default=DEFAULT_AUTH_TIMEOUT,
         help=f"ACP handshake timeout in seconds (default: {DEFAULT_AUTH_TIMEOUT})",
     )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=DEFAULT_JOBS,
+        help=f"Number of agents to verify concurrently (default: {DEFAULT_JOBS})",
+    )
     args = parser.parse_args()
 
     # Always show what's happening
@@ -729,22 +1048,23 @@ Examples:
         all_agent_ids = [a["id"] for a in agents]
 
         # Check for invalid agent IDs (quarantined agents are valid but skipped)
-        invalid = [
-            aid for aid in requested_ids if aid not in all_agent_ids and aid not in quarantine
-        ]
+        known_ids = set(all_agent_ids).union(quarantine)
+        invalid = [aid for aid in requested_ids if aid not in known_ids]
         if invalid:
             print(f"Unknown agent(s): {', '.join(invalid)}")
             print(f"Available: {', '.join(all_agent_ids)}")
             sys.exit(1)
 
-        agents = [a for a in agents if a["id"] in requested_ids]
+        requested = frozenset(requested_ids)
+        agents = [a for a in agents if a["id"] in requested]
         print(f"Verifying {len(agents)} agent(s): {', '.join(a['id'] for a in agents)}")
         print()
 
     # Verify each agent
     all_results = []
     total = len(agents)
-    for idx, agent in enumerate(agents, 1):
+
+    def verify_one(idx: int, agent: dict) -> list[Result]:
         agent_id = agent["id"]
         dist_types = list(agent.get("distribution", {}).keys())
         print(f"[{idx}/{total}] {agent_id} ({', '.join(dist_types)})")
@@ -759,9 +1079,33 @@ Examples:
             auth_check=args.auth_check,
             auth_timeout=args.auth_timeout,
         )
-
-        all_results.extend(results)
         print()
+        return results
+
+    jobs = max(1, min(args.jobs, total))
+    if jobs == 1:
+        for idx, agent in enumerate(agents, 1):
+            all_results.extend(verify_one(idx, agent))
+    else:
+        # Agents use separate sandboxes and processes, so they can run side by side;
+        # each worker's output is buffered and printed in agent order
+        stdout = sys.stdout
+        output = _ThreadLocalOutput(stdout)
+        sys.stdout = output
+
+        def verify_captured(idx: int, agent: dict) -> tuple[str, list[Result]]:
+            with output.capture() as buffer:
+                results = verify_one(idx, agent)
+            return buffer.getvalue(), results
+
+        try:
+            with ThreadPoolExecutor(max_workers=jobs) as executor:
+                for text, results in executor.map(verify_captured, range(1, total + 1), agents):
+                    output.write(text)
+                    output.flush()
+                    all_results.extend(results)
+        finally:
+            sys.stdout = stdout
 
     # Summary
     passed = [r for r in all_results if r.success and not r.skipped]